@@ -58,11 +58,53 @@ Note:
     as-is without validation to maintain separation of concerns.
 """
 
-from dataclasses import dataclass, field
+import re
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
-from iso639.exceptions import InvalidLanguageValue
-from .enums import WordTimingMode
+from .enums import WordTimingMode, _WORD_TIMING_MODES_BY_VALUE
+
+# Shape of the timestamps read from created_at: a calendar date and a time
+# of day, with optional seconds, fraction and UTC offset. Other ISO 8601
+# forms that fromisoformat or dateutil accept, such as "2024-W12" or
+# "2024-03", are left unparsed so that validation reports them
+_TIMESTAMP_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}"
+    r"(?::[0-9]{2}(?:\.[0-9]+)?)?(?:Z|[+-][0-9]{2}:[0-9]{2})?"
+)
+
+# Serialized value of each word timing mode, looked up without going
+# through the enum's value descriptor
+_WORD_TIMING_MODE_VALUES = {mode: mode.value for mode in WordTimingMode}
+
+
+def _add_slots(cls: type) -> type:
+    """Recreates a dataclass with __slots__ for its fields.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10. Instances
+    store their fields in slots instead of a per-instance __dict__, which
+    makes large transcripts (one object per word) smaller and attribute
+    access faster. Must be applied on top of @dataclass.
+
+    Args:
+        cls (type): Dataclass to recreate
+
+    Returns:
+        type: New class with the same fields and methods, using __slots__
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    # Field defaults are already baked into the generated __init__ and would
+    # conflict with the slot descriptors
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
 
 
 def _deserialize_language(code: Optional[str]) -> Optional[str]:
@@ -88,7 +130,120 @@ def _deserialize_language(code: Optional[str]) -> Optional[str]:
         This function intentionally does not validate the language code,
         leaving that responsibility to the validation layer.
     """
-    return code
+    return _intern(code)
+
+
+def _deserialize_word_timing_mode(value: Any) -> WordTimingMode:
+    """Converts a serialized word_timing_mode to its WordTimingMode member.
+
+    Known values are looked up in a dict; anything else goes through
+    WordTimingMode(value), which passes members through and raises for
+    invalid values.
+
+    Args:
+        value (Any): Serialized mode such as "complete", or a member
+
+    Returns:
+        WordTimingMode: The matching member
+
+    Raises:
+        ValueError: If value is not a valid word timing mode
+    """
+    try:
+        return _WORD_TIMING_MODES_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return WordTimingMode(value)
+
+
+def _intern(value: Any) -> Any:
+    """Interns string identifiers that repeat across a transcript.
+
+    Speaker IDs, style IDs and language codes are shared by many segments.
+    Interning them keeps a single copy of each string in memory and makes
+    comparing them against the speaker and style IDs a pointer check.
+    Values that are not strings are returned unchanged for validation.
+
+    Args:
+        value (Any): Identifier read from a dictionary
+
+    Returns:
+        Any: The interned string, or value itself if it is not a str
+
+    Example:
+        ```python
+        speaker_id = _intern("speaker1")  # Shared "speaker1" string
+        speaker_id = _intern(5)  # Returns 5 for later validation
+        ```
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _iso_z(dt: datetime) -> str:
+    """Formats a datetime as an ISO 8601 UTC timestamp with a 'Z' suffix.
+
+    Fractional seconds are included only when the datetime has microseconds,
+    as with datetime.isoformat.
+
+    Args:
+        dt (datetime): Datetime to format; naive values are taken as local time
+
+    Returns:
+        str: Timestamp such as "2023-01-01T12:00:00Z"
+
+    Example:
+        ```python
+        ts = _iso_z(datetime(2023, 1, 1, 12, tzinfo=timezone.utc))
+        # "2023-01-01T12:00:00Z"
+        ```
+    """
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return dt.replace(tzinfo=None).isoformat() + "Z"
+
+
+def _deserialize_timestamp(value: Any) -> Any:
+    """Deserializes an ISO 8601 timestamp without raising exceptions.
+
+    Only date-time strings (see _TIMESTAMP_RE) are parsed, using
+    datetime.fromisoformat with a trailing 'Z' read as UTC. Before Python
+    3.11, timestamps fromisoformat cannot read (such as one or two
+    fractional second digits) are parsed with dateutil's isoparse instead.
+    Other values, including other ISO 8601 forms such as week dates, are
+    preserved as-is for later validation.
+
+    Args:
+        value (Any): Timestamp string, or any other value
+
+    Returns:
+        Any: Parsed datetime, None for empty values, or the original value
+        if it could not be parsed
+
+    Example:
+        ```python
+        ts = _deserialize_timestamp("2023-01-01T12:00:00Z")  # UTC datetime
+        ts = _deserialize_timestamp("not a date")  # Returns "not a date"
+        ```
+    """
+    if not value:
+        return None
+    if not isinstance(value, str):
+        return value  # Preserve invalid type for validation
+    if not _TIMESTAMP_RE.fullmatch(value):
+        return value  # Preserve invalid timestamp for validation
+    try:
+        # Handle 'Z' at the end of the timestamp
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if sys.version_info >= (3, 11):
+            return value  # Out-of-range fields, such as month 13
+    from dateutil.parser import isoparse  # Deferred: only needed before 3.11
+
+    try:
+        return isoparse(value)
+    except (ValueError, OverflowError):
+        return value  # Preserve invalid timestamp for validation
 
 
 def _deserialize_languages(languages_data: Optional[List[str]]) -> Optional[List[str]]:
@@ -119,6 +274,7 @@ def _deserialize_languages(languages_data: Optional[List[str]]) -> Optional[List
     return languages_data
 
 
+@_add_slots
 @dataclass
 class STJ:
     """Root object representing the STJ structure.
@@ -205,6 +361,7 @@ class STJ:
         return {"stj": result}
 
 
+@_add_slots
 @dataclass
 class Transcriber:
     """Metadata about the transcription system or service.
@@ -285,6 +442,7 @@ class Transcriber:
         return result if result else None
 
 
+@_add_slots
 @dataclass
 class Source:
     """Source metadata for the transcription.
@@ -378,6 +536,7 @@ class Source:
         return result
 
 
+@_add_slots
 @dataclass
 class Metadata:
     """Metadata for the Standard Transcription JSON (STJ).
@@ -455,27 +614,11 @@ class Metadata:
         if not isinstance(data, dict):
             return cls(_invalid_type=type(data).__name__)
 
-        # Handle both 'Z' and '+00:00' timezone formats
-        created_at_str = data.get("created_at")
-        if created_at_str:
-            try:
-                # Handle 'Z' at the end of the timestamp
-                if created_at_str.endswith("Z"):
-                    created_at = datetime.fromisoformat(created_at_str[:-1]).replace(
-                        tzinfo=timezone.utc
-                    )
-                else:
-                    created_at = datetime.fromisoformat(created_at_str)
-            except ValueError:
-                created_at = created_at_str  # Preserve invalid timestamp for validation
-        else:
-            created_at = None
-
         return cls(
             transcriber=Transcriber.from_dict(data["transcriber"])
             if "transcriber" in data
             else None,
-            created_at=created_at,
+            created_at=_deserialize_timestamp(data.get("created_at")),
             source=Source.from_dict(data["source"]) if "source" in data else None,
             languages=_deserialize_languages(data.get("languages")),
             confidence_threshold=data.get("confidence_threshold"),
@@ -505,13 +648,11 @@ class Metadata:
         result = {}
         if self.transcriber:
             result["transcriber"] = self.transcriber.to_dict()
-        if self.created_at:
-            iso_str = (
-                self.created_at.astimezone(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-            result["created_at"] = iso_str
+        if isinstance(self.created_at, datetime):
+            result["created_at"] = _iso_z(self.created_at)
+        elif self.created_at:
+            # Preserve unparsed values as-is for validation
+            result["created_at"] = self.created_at
         if self.source:
             result["source"] = self.source.to_dict()
         if self.languages:
@@ -523,6 +664,7 @@ class Metadata:
         return result if result else None
 
 
+@_add_slots
 @dataclass
 class Speaker:
     """Speaker in the transcript.
@@ -595,7 +737,9 @@ class Speaker:
             ```
         """
         return cls(
-            id=data["id"], name=data.get("name"), extensions=data.get("extensions", {})
+            id=_intern(data["id"]),
+            name=data.get("name"),
+            extensions=data.get("extensions", {}),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -620,6 +764,7 @@ class Speaker:
         return result
 
 
+@_add_slots
 @dataclass
 class Style:
     """Style for transcript formatting.
@@ -694,7 +839,7 @@ class Style:
             A new Style instance.
         """
         return cls(
-            id=data["id"],
+            id=_intern(data["id"]),
             text=data.get("text"),
             display=data.get("display"),
             extensions=data.get("extensions", {}),
@@ -716,6 +861,7 @@ class Style:
         return result
 
 
+@_add_slots
 @dataclass
 class Word:
     """Single word with timing and confidence information.
@@ -801,6 +947,43 @@ class Word:
             extensions=data.get("extensions", {}),
         )
 
+    @classmethod
+    def from_dicts(cls, items: List[Dict[str, Any]]) -> List["Word"]:
+        """Creates Word instances from a list of dictionaries.
+
+        Equivalent to calling from_dict on each item, but assigns the fields
+        of each new instance directly instead of going through the generated
+        __init__, which speeds up loading segments with many words.
+
+        Args:
+            items (List[Dict[str, Any]]): Word dictionaries as accepted by
+                from_dict
+
+        Returns:
+            List[Word]: A new Word instance for each item, in order
+
+        Example:
+            ```python
+            words = Word.from_dicts([
+                {"text": "hello", "start": 0.0, "end": 0.5},
+                {"text": "world", "start": 0.6, "end": 1.0},
+            ])
+            ```
+        """
+        new = object.__new__
+        words = []
+        append = words.append
+        for data in items:
+            word = new(cls)
+            word.start = data.get("start")
+            word.end = data.get("end")
+            word.is_zero_duration = data.get("is_zero_duration")
+            word.text = data["text"]
+            word.confidence = data.get("confidence")
+            word.extensions = data.get("extensions", {})
+            append(word)
+        return words
+
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Word instance to a dictionary.
 
@@ -828,7 +1011,48 @@ class Word:
             result["extensions"] = self.extensions
         return result
 
+    @staticmethod
+    def to_dicts(words: List["Word"]) -> List[Dict[str, Any]]:
+        """Converts a list of Word instances to dictionaries.
+
+        Equivalent to calling to_dict on each word, but reads each field once
+        in a single loop, which speeds up serializing segments with many words.
+
+        Args:
+            words (List[Word]): Words to convert
 
+        Returns:
+            List[Dict[str, Any]]: A dictionary for each word, in order
+
+        Example:
+            ```python
+            data = Word.to_dicts(segment.words)
+            ```
+        """
+        result = []
+        append = result.append
+        for word in words:
+            data = {"text": word.text}
+            value = word.start
+            if value is not None:
+                data["start"] = value
+            value = word.end
+            if value is not None:
+                data["end"] = value
+            value = word.is_zero_duration
+            if value is not None:
+                data["is_zero_duration"] = value
+            value = word.confidence
+            if value is not None:
+                data["confidence"] = value
+            value = word.extensions
+            if value:
+                data["extensions"] = value
+            append(data)
+        return result
+
+
+@_add_slots
 @dataclass
 class Segment:
     """Timed segment in the transcript with optional word-level detail.
@@ -935,16 +1159,14 @@ class Segment:
             end=data.get("end"),
             is_zero_duration=data.get("is_zero_duration"),
             text=data.get("text", ""),  # Provide default for required field
-            speaker_id=data.get("speaker_id"),
+            speaker_id=_intern(data.get("speaker_id")),
             confidence=data.get("confidence"),
             language=_deserialize_language(data.get("language")),
-            style_id=data.get("style_id"),
-            word_timing_mode=WordTimingMode(data["word_timing_mode"])
+            style_id=_intern(data.get("style_id")),
+            word_timing_mode=_deserialize_word_timing_mode(data["word_timing_mode"])
             if "word_timing_mode" in data
             else None,
-            words=[Word.from_dict(w) for w in data["words"]]
-            if "words" in data
-            else None,
+            words=Word.from_dicts(data["words"]) if "words" in data else None,
             extensions=data.get("extensions"),
         )
 
@@ -983,18 +1205,20 @@ class Segment:
             result["style_id"] = self.style_id
         if self.word_timing_mode is not None:
             # Handle both string and enum values
+            mode = self.word_timing_mode
             result["word_timing_mode"] = (
-                self.word_timing_mode.value
-                if isinstance(self.word_timing_mode, WordTimingMode)
-                else self.word_timing_mode
+                _WORD_TIMING_MODE_VALUES[mode]
+                if isinstance(mode, WordTimingMode)
+                else mode
             )
         if self.words is not None:
-            result["words"] = [w.to_dict() for w in self.words]
+            result["words"] = Word.to_dicts(self.words)
         if self.extensions:
             result["extensions"] = self.extensions
         return result
 
 
+@_add_slots
 @dataclass
 class Transcript:
     """Main content of the transcription.
@@ -103,3 +103,7 @@ class WordTimingMode(Enum):
     COMPLETE = "complete"
     PARTIAL = "partial"
     NONE = "none"
+
+
+# Members by value, for lookups that skip Enum.__call__ on hot paths
+_WORD_TIMING_MODES_BY_VALUE = {mode.value: mode for mode in WordTimingMode}
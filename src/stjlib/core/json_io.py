@@ -0,0 +1,184 @@
+# stjlib/core/json_io.py
+
+"""JSON encoding and decoding for STJLib.
+
+This module wraps the JSON library used to read and write STJ documents.
+When orjson is installed it is used for both directions; otherwise the
+standard library json module is used. Callers get the same results either
+way.
+
+Key Features:
+    * Encoding and decoding in C via orjson when available
+    * Automatic fallback to the standard library json module
+    * UTF-8 byte input and output, with BOM handling on input
+    * Incremental decoding of large arrays via ijson, when installed
+
+Example:
+    ```python
+    from stjlib.core.json_io import dumps, loads
+
+    data = loads(b'{"stj": {"version": "0.6.0"}}')
+    encoded = dumps(data, indent=True)
+    ```
+
+Note:
+    - Values orjson cannot encode (such as Decimal or integers wider than
+      64 bits) are encoded with the standard library instead
+    - Documents orjson rejects (such as NaN or Infinity literals) are
+      decoded with the standard library, which also produces the
+      json.JSONDecodeError raised for invalid documents
+    - Non-finite floats are always written as NaN/Infinity literals, as the
+      standard library does; orjson would write them as null, so documents
+      containing them are encoded with the standard library
+    - load_streaming requires ijson and, unlike loads, rejects NaN and
+      Infinity literals
+"""
+
+import codecs
+import json
+import math
+from typing import IO, Any, Callable, Dict, Iterable, List, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parses a JSON document.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes (a leading BOM is ignored)
+
+    Returns:
+        Any: The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if isinstance(data, bytes) and data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8) :]
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let the standard library parse or report the error
+    return json.loads(data)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Checks whether a decoded JSON structure contains NaN or infinite floats.
+
+    Args:
+        obj: Object made of dicts, lists, strings, numbers, booleans and None
+
+    Returns:
+        bool: True if any float in obj (keys included) is NaN or infinite
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes an object to a UTF-8 encoded JSON document.
+
+    Args:
+        obj: Object made of dicts, lists, strings, numbers, booleans and None
+        indent: If True, indent nested structures by two spaces
+
+    Returns:
+        bytes: The encoded JSON document
+
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass  # Let the standard library encode or report the error
+        else:
+            # orjson writes NaN and Infinity as null, which would silently
+            # change the data; only output containing null needs checking
+            if b"null" not in encoded or not _has_non_finite_float(obj):
+                return encoded
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def load_streaming(
+    f: IO[bytes], item_prefixes: Iterable[str], convert: Callable[[Any], Any]
+) -> Tuple[Any, Dict[str, List[Any]]]:
+    """Parses a JSON document from a binary file, converting array items as they arrive.
+
+    Items of the arrays at item_prefixes are passed to convert one at a time
+    while the file is read, so only one decoded item is held in memory at a
+    time instead of the whole array. The rest of the document is decoded
+    as usual, with those arrays left empty.
+
+    Args:
+        f: Binary file positioned at the start of the document (a leading
+            BOM is ignored)
+        item_prefixes: Dotted paths of the arrays to stream, in ijson prefix
+            notation (such as "stj.transcript.segments")
+        convert: Called with each decoded array item; its result is kept
+
+    Returns:
+        Tuple[Any, Dict[str, List[Any]]]: The decoded document, and the
+        converted items of each streamed array found, keyed by its path
+
+    Raises:
+        ImportError: If ijson is not installed
+        json.JSONDecodeError: If the document is not valid JSON
+
+    Example:
+        ```python
+        with open("large.stjson", "rb") as f:
+            data, items = load_streaming(f, ["stj.transcript.segments"], dict)
+        ```
+    """
+    import ijson
+
+    if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+        f.seek(0)
+    item_paths = {prefix + ".item": prefix for prefix in item_prefixes}
+    items: Dict[str, List[Any]] = {}
+    document = ijson.ObjectBuilder()
+    item = None  # Builder of the array item being decoded
+    depth = 0
+    try:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if item is None and prefix not in item_paths:
+                document.event(event, value)
+                continue
+            if item is None:
+                item = ijson.ObjectBuilder()
+                path = item_paths[prefix]
+            item.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                items.setdefault(path, []).append(convert(item.value))
+                item = None
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(f"Invalid JSON: {e}", "", 0) from e
+    return document.value, items
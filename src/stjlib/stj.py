@@ -73,9 +73,10 @@ Format Structure:
 # Standard library imports
 import json
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, Iterator
+from typing import Optional, Dict, Any, List, Iterator, Union
 
 # Local imports
+from .core import json_io
 from .core.data_classes import (
     STJ,
     Metadata,
@@ -231,11 +232,16 @@ class StandardTranscriptionJSON:
         if validate:
             self.validate()
 
-    def validate(self, raise_exception: bool = True) -> Optional[ValidationIssues]:
+    def validate(
+        self, raise_exception: bool = True, fail_fast: bool = False
+    ) -> Optional[ValidationIssues]:
         """Validates the STJ data according to specification requirements.
 
         Args:
             raise_exception: If True, raises ValidationError for any issues.
+            fail_fast: If True, stop at the first validation stage that reports
+                issues instead of running the remaining stages. Useful for
+                rejecting invalid documents quickly when only validity matters.
 
         Returns:
             Optional[ValidationIssues]: List of validation issues if found, None if valid.
@@ -243,7 +249,7 @@ class StandardTranscriptionJSON:
         Raises:
             ValidationError: If validation fails and raise_exception is True.
         """
-        issues = validate_stj(self._stj)
+        issues = validate_stj(self._stj, fail_fast=fail_fast)
         if issues and raise_exception:
             raise ValidationError(issues)
         return issues if issues else None
@@ -269,14 +275,93 @@ class StandardTranscriptionJSON:
             ValidationError: If validation fails or data structure is invalid
         """
         try:
-            with open(filename, "r", encoding="utf-8-sig") as f:
-                data = json.load(f)
-            return cls.from_dict(data, validate=validate)
+            with open(filename, "rb") as f:
+                return cls.from_json_bytes(f.read(), validate=validate)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File not found: {filename}") from e
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"JSON decode error: {e.msg}", e.doc, e.pos)
 
+    @classmethod
+    def from_file_streaming(
+        cls, filename: str, validate: bool = False
+    ) -> "StandardTranscriptionJSON":
+        """Creates a StandardTranscriptionJSON instance from a large JSON file.
+
+        Like from_file, but segments are parsed with ijson and converted to
+        Segment objects one at a time as the file is read. Peak memory is
+        the loaded transcript plus a single decoded segment, instead of the
+        file contents and the whole decoded document on top of it.
+
+        Args:
+            filename: Path to the JSON file to load
+            validate: Whether to validate the loaded data
+
+        Returns:
+            StandardTranscriptionJSON: New instance with loaded data
+
+        Raises:
+            ImportError: If ijson is not installed (pip install stjlib[stream])
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If the file is not valid JSON
+            ValidationError: If validate=True and the data fails validation
+
+        Example:
+            ```python
+            stj = StandardTranscriptionJSON.from_file_streaming("long.stjson")
+            ```
+
+        Note:
+            - Slower than from_file for small files; use it when memory matters
+            - NaN and Infinity literals are rejected as invalid JSON
+        """
+        wrapped_path = "stj.transcript.segments"
+        bare_path = "transcript.segments"
+        try:
+            with open(filename, "rb") as f:
+                data, segments = json_io.load_streaming(
+                    f, [wrapped_path, bare_path], Segment.from_dict
+                )
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {filename}") from e
+
+        stj = STJ.from_dict(data)
+        # The streamed segments arrays were left empty in data
+        transcript = stj.transcript
+        if transcript is not None and transcript._invalid_segments_type is None:
+            is_wrapped = isinstance(data, dict) and "stj" in data
+            transcript.segments = segments.get(
+                wrapped_path if is_wrapped else bare_path, []
+            )
+        instance = cls.create_from_stj(stj)
+
+        if validate:
+            instance.validate()
+
+        return instance
+
+    @classmethod
+    def from_json_bytes(
+        cls, data: Union[str, bytes], validate: bool = False
+    ) -> "StandardTranscriptionJSON":
+        """Creates a StandardTranscriptionJSON instance from a JSON document.
+
+        The document is decoded by orjson when it is installed, straight from
+        the UTF-8 bytes, and by the standard library otherwise.
+
+        Args:
+            data: JSON document as UTF-8 bytes or text
+            validate: Whether to validate the loaded data
+
+        Returns:
+            StandardTranscriptionJSON: New instance with loaded data
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+            ValidationError: If validate=True and the data fails validation
+        """
+        return cls.from_dict(json_io.loads(data), validate=validate)
+
     @classmethod
     def from_dict(
         cls, data: STJDict, validate: bool = False
@@ -312,13 +397,23 @@ class StandardTranscriptionJSON:
         Raises:
             IOError: If there's an error writing to the file
         """
-        data = self.to_dict()
+        data = json_io.dumps(self.to_dict(), indent=True)
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(data)
         except IOError as e:
             raise IOError(f"Error writing to file {filename}: {e}")
 
+    def to_json_bytes(self) -> bytes:
+        """Serializes the STJ instance to a compact UTF-8 encoded JSON document.
+
+        Uses orjson when it is installed and the standard library otherwise.
+
+        Returns:
+            bytes: JSON document for the dictionary returned by to_dict()
+        """
+        return json_io.dumps(self.to_dict())
+
     def to_dict(self) -> STJDict:
         """Convert to STJ format dictionary.
 
@@ -430,9 +525,10 @@ class StandardTranscriptionJSON:
         if not id or not id.strip():
             raise ValueError("Speaker ID cannot be empty or contain only whitespace")
 
-        # Check for duplicate speaker id
-        existing_speakers = [s.id for s in self._stj.transcript.speakers]
-        if id in existing_speakers:
+        # Check for duplicate speaker id. Speakers can be replaced or renamed
+        # directly on the transcript, so the list itself is scanned rather
+        # than a cached index; the scan stops at the first match
+        if any(s.id == id for s in self._stj.transcript.speakers):
             raise ValueError(f"Speaker with id '{id}' already exists")
 
         speaker = Speaker(id=id, name=name)
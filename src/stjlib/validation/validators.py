@@ -46,18 +46,37 @@ Note:
     * Reference to relevant specification section
 """
 
-from dataclasses import dataclass, fields, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_EVEN
 import re
-from typing import Any, Dict, List, Optional, Union, Type, Callable, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+    Type,
+    Callable,
+    Tuple,
+)
 from urllib.parse import urlparse, urljoin
 from enum import Enum, auto
 import math
+import os
+import string
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
 
-from iso639 import Lang, is_language
-from iso639.exceptions import InvalidLanguageValue, DeprecatedLanguageValue
+if TYPE_CHECKING:  # iso639 is imported when language codes are first checked
+    from iso639 import Lang
+
+try:  # NumPy is optional; it only accelerates validation of long word lists
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
 
 from ..core.data_classes import (
     STJ,
@@ -69,14 +88,25 @@ from ..core.data_classes import (
     Style,
     Source,
     Transcriber,
+    _deserialize_timestamp,
 )
-from ..core.enums import WordTimingMode
+from ..core.enums import WordTimingMode, _WORD_TIMING_MODES_BY_VALUE
 
 # Validation constants
 MAX_TIME_VALUE = 999999.999
 MAX_DECIMAL_PLACES = 3
 MAX_SPEAKER_ID_LENGTH = 64
 
+# Lists of words, segments or confidences at least this long are
+# pre-screened with NumPy when available
+NUMPY_MIN_WORDS = 64
+
+# Compile the NumPy screening kernels with Numba. Off by default: compiling
+# (or loading cached kernels) costs far more than the vectorized NumPy code
+# takes, so it only pays off for very large batches. Set STJLIB_JIT=1 in the
+# environment, or this flag at runtime, to opt in
+USE_JIT = os.environ.get("STJLIB_JIT", "").lower() in ("1", "true", "yes")
+
 # Regular expression patterns
 SPEAKER_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
 NAMESPACE_PATTERN = r"^[a-z0-9\-]+$"
@@ -84,6 +114,18 @@ SEMVER_PATTERN = r"^\d+\.\d+\.\d+$"
 TEXT_NORMALIZATION_PATTERN = r"[^\w\s]"
 URI_INVALID_CHARS_PATTERN = r"[^\w\-\.~:/?#\[\]@!$&\'()*+,;=%]"
 
+# Compiled forms of the patterns matched on every validation
+SEMVER_RE = re.compile(SEMVER_PATTERN)
+TEXT_NORMALIZATION_RE = re.compile(TEXT_NORMALIZATION_PATTERN)
+URI_INVALID_CHARS_RE = re.compile(URI_INVALID_CHARS_PATTERN)
+
+# Characters allowed in speaker and style IDs (see SPEAKER_ID_PATTERN)
+ID_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Style value formats
+COLOR_RE = re.compile(r"#[0-9A-Fa-f]{6}")
+PERCENTAGE_RE = re.compile(r"\d+%")
+
 # Reserved namespaces
 RESERVED_NAMESPACES = frozenset(
     {"stj", "webvtt", "ttml", "ssa", "srt", "dfxp", "smptett"}
@@ -93,14 +135,14 @@ RESERVED_NAMESPACES = frozenset(
 RECOMMENDED_URI_SCHEMES = frozenset({"http", "https", "file"})
 
 # Style validation constants
-VALID_TEXT_PROPERTIES = frozenset(
-    {"color", "background", "bold", "italic", "underline", "size", "opacity"}
-)
-
 VALID_ALIGN_VALUES = frozenset({"left", "center", "right"})
 
 VALID_VERTICAL_VALUES = frozenset({"top", "middle", "bottom"})
 
+# Allowed values as listed in error messages, joined once
+_ALIGN_VALUES_TEXT = ", ".join(sorted(VALID_ALIGN_VALUES))
+_VERTICAL_VALUES_TEXT = ", ".join(sorted(VALID_VERTICAL_VALUES))
+
 
 class WordTimingStatus(Enum):
     """Enum for word timing validation status."""
@@ -147,7 +189,9 @@ class ValidationIssue:
             Example: "transcript.segments[0].words[2].start"
         severity (ValidationSeverity): Severity level of the issue (ERROR, WARNING, INFO).
         spec_ref (Optional[str]): Reference to relevant specification section.
-        error_code (Optional[str]): Add error code
+        error_code (Optional[str]): Stable machine-readable code for the kind of
+            issue, such as "INVALID_STRUCTURE" or "CONFIDENCE_OUT_OF_RANGE".
+            Compare against this rather than matching on message text.
         suggestion (Optional[str]): Add suggestion for fix
 
     Example:
@@ -266,9 +310,8 @@ def validate_metadata(metadata: Metadata) -> List[ValidationIssue]:
                     )
                 )
         elif isinstance(metadata.created_at, str):
-            try:
-                datetime.fromisoformat(metadata.created_at.replace("Z", "+00:00"))
-            except ValueError:
+            # Strings that Metadata.from_dict could not read as a timestamp
+            if not isinstance(_deserialize_timestamp(metadata.created_at), datetime):
                 issues.append(
                     ValidationIssue(
                         message="Invalid 'created_at' format. Must be a valid ISO 8601 timestamp.",
@@ -296,6 +339,7 @@ def validate_metadata(metadata: Metadata) -> List[ValidationIssue]:
                     location="metadata.confidence_threshold",
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#metadata-confidence-threshold",
+                    error_code="CONFIDENCE_OUT_OF_RANGE",
                 )
             )
 
@@ -375,8 +419,7 @@ def validate_version(version: str) -> List[ValidationIssue]:
         )
     else:
         # Check semantic versioning format
-        semver_pattern = SEMVER_PATTERN
-        if not re.match(semver_pattern, version):
+        if not SEMVER_RE.match(version):
             issues.append(
                 ValidationIssue(
                     message=f"Invalid 'stj.version' format: '{version}'. Must follow semantic versioning 'MAJOR.MINOR.PATCH' (e.g., '0.6.0').",
@@ -501,7 +544,7 @@ def validate_uri(
                 )
 
     # Validate URI characters according to RFC 3986
-    if re.search(URI_INVALID_CHARS_PATTERN, uri):
+    if URI_INVALID_CHARS_RE.search(uri):
         issues.append(
             ValidationIssue(
                 message="URI contains invalid characters not allowed by RFC 3986.",
@@ -514,6 +557,72 @@ def validate_uri(
     return issues
 
 
+@lru_cache(maxsize=None)
+def _accepted_language_codes() -> frozenset:
+    """
+    Collect the language codes that pass validate_language_code.
+
+    These are every ISO 639-1 code and the ISO 639-3 codes of languages
+    without one. The set is built on first use rather than at import, since
+    walking the ISO 639 tables is slow.
+
+    Returns:
+        frozenset: Accepted ISO 639-1 and ISO 639-3 codes
+    """
+    from iso639 import iter_langs
+
+    return frozenset(
+        lang.pt1 or lang.pt3 for lang in iter_langs() if lang.pt1 or lang.pt3
+    )
+
+
+@lru_cache(maxsize=2048)
+def _language_code_error(code: str) -> Optional[str]:
+    """Checks a stripped, non-empty language code against ISO 639.
+
+    Results are cached per code since documents repeat the same few codes.
+
+    Args:
+        code: Language code to check
+
+    Returns:
+        Optional[str]: Error message, or None if the code is valid
+    """
+    # Valid codes are found with a set lookup; only invalid ones need
+    # the iso639 checks below to pick the error message
+    if code in _accepted_language_codes():
+        return None
+
+    from iso639 import is_language
+
+    # Check if code is valid ISO 639-1 or ISO 639-3 code
+    if len(code) == 2:
+        if not is_language(code, identifiers_or_names="pt1"):
+            return f"Invalid ISO 639-1 language code '{code}'."
+    elif len(code) == 3:
+        if not is_language(code, identifiers_or_names="pt3"):
+            return f"Invalid ISO 639-3 language code '{code}'."
+        # Enforce the use of ISO 639-1 code if available
+        lang = _lookup_language(code)
+        if lang is not None and lang.pt1:
+            return f"Must use ISO 639-1 code '{lang.pt1}' instead of ISO 639-3 code '{code}'."
+    else:
+        return f"Invalid language code '{code}'. Language codes must be 2-letter (ISO 639-1) or 3-letter (ISO 639-3) codes."
+    return None
+
+
+@lru_cache(maxsize=2048)
+def _lookup_language(code: str) -> Optional["Lang"]:
+    """Cached Lang(code) lookup; unknown codes give None, which is cached too."""
+    from iso639 import Lang
+    from iso639.exceptions import InvalidLanguageValue
+
+    try:
+        return Lang(code)
+    except (KeyError, InvalidLanguageValue):
+        return None
+
+
 def validate_language_code(code: str, location: str) -> List[ValidationIssue]:
     """Validates a single language code against ISO standards.
 
@@ -551,52 +660,20 @@ def validate_language_code(code: str, location: str) -> List[ValidationIssue]:
                 location=location,
                 severity=ValidationSeverity.ERROR,
                 spec_ref="#language-codes",
+                error_code="INVALID_LANGUAGE_CODE",
             )
         )
         return issues
 
-    code = code.strip()
-
-    # Check if code is valid ISO 639-1 or ISO 639-3 code
-    if len(code) == 2:
-        if not is_language(code, identifiers_or_names="pt1"):
-            issues.append(
-                ValidationIssue(
-                    message=f"Invalid ISO 639-1 language code '{code}'.",
-                    location=location,
-                    severity=ValidationSeverity.ERROR,
-                    spec_ref="#language-codes",
-                )
-            )
-    elif len(code) == 3:
-        if not is_language(code, identifiers_or_names="pt3"):
-            issues.append(
-                ValidationIssue(
-                    message=f"Invalid ISO 639-3 language code '{code}'.",
-                    location=location,
-                    severity=ValidationSeverity.ERROR,
-                    spec_ref="#language-codes",
-                )
-            )
-        else:
-            # Enforce the use of ISO 639-1 code if available
-            lang = Lang(code)
-            if lang.pt1:
-                issues.append(
-                    ValidationIssue(
-                        message=f"Must use ISO 639-1 code '{lang.pt1}' instead of ISO 639-3 code '{code}'.",
-                        location=location,
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#language-codes",
-                    )
-                )
-    else:
+    message = _language_code_error(code.strip())
+    if message is not None:
         issues.append(
             ValidationIssue(
-                message=f"Invalid language code '{code}'. Language codes must be 2-letter (ISO 639-1) or 3-letter (ISO 639-3) codes.",
+                message=message,
                 location=location,
                 severity=ValidationSeverity.ERROR,
                 spec_ref="#language-codes",
+                error_code="INVALID_LANGUAGE_CODE",
             )
         )
 
@@ -633,6 +710,23 @@ def validate_language_codes(
         - Validates consistency between different language code usages
         - Empty lists of language codes are valid
     """
+    return _validate_language_codes(metadata, transcript)
+
+
+def _validate_language_codes(
+    metadata: Metadata,
+    transcript: Optional[Transcript],
+    segment_issues: Optional[List[ValidationIssue]] = None,
+) -> List[ValidationIssue]:
+    """
+    Implementation of validate_language_codes.
+
+    Args:
+        metadata: Metadata object containing language codes
+        transcript: Transcript object containing segment languages
+        segment_issues: Segment language issues from an earlier walk (see
+            _walk_segments), used instead of walking the segments again
+    """
     issues = []
 
     if metadata is not None:
@@ -649,14 +743,10 @@ def validate_language_codes(
                 )
             )
 
-    if transcript is not None and transcript.segments:
-        for idx, segment in enumerate(transcript.segments):
-            if segment.language:
-                issues.extend(
-                    validate_language_code(
-                        segment.language, f"transcript.segments[{idx}].language"
-                    )
-                )
+    if segment_issues is not None:
+        issues.extend(segment_issues)
+    elif transcript is not None and transcript.segments:
+        _walk_segments(transcript.segments, language_issues=issues)
 
     return issues
 
@@ -704,6 +794,27 @@ def validate_language_consistency(
         - Checks apply across metadata, source, and segment languages
         - Warnings rather than errors as mixing codes is allowed but discouraged
     """
+    return _validate_language_consistency(metadata, transcript)
+
+
+def _validate_language_consistency(
+    metadata: Metadata,
+    transcript: Transcript,
+    segment_languages: Optional[List[Tuple[str, str]]] = None,
+) -> List[ValidationIssue]:
+    """
+    Implementation of validate_language_consistency.
+
+    Args:
+        metadata: Metadata object containing language information
+        transcript: Transcript object containing segment languages
+        segment_languages: (location, code) pairs of the segment languages
+            from an earlier walk (see _walk_segments), used instead of walking
+            the segments again
+    """
+    from iso639 import Lang
+    from iso639.exceptions import InvalidLanguageValue
+
     issues = []
     language_code_map = {}
 
@@ -711,7 +822,9 @@ def validate_language_consistency(
     def track_codes(codes: List[str], source: str) -> None:
         for code in codes:
             try:
-                lang = Lang(code)
+                lang = _lookup_language(code) if isinstance(code, str) else Lang(code)
+                if lang is None:
+                    continue  # Error already reported by validate_language_code
                 # Check if ISO 639-1 code exists but ISO 639-3 was used
                 if len(code) == 3 and lang.pt1:
                     issues.append(
@@ -740,10 +853,12 @@ def validate_language_consistency(
         if metadata.source and metadata.source.languages:
             track_codes(metadata.source.languages, "metadata.source.languages")
 
-    if transcript and transcript.segments:
-        for idx, segment in enumerate(transcript.segments):
-            if segment.language:
-                track_codes([segment.language], f"transcript.segments[{idx}].language")
+    if segment_languages is None:
+        segment_languages = []
+        if transcript and transcript.segments:
+            _walk_segments(transcript.segments, languages=segment_languages)
+    for location, code in segment_languages:
+        track_codes([code], location)
 
     # Check for inconsistencies
     for language, data in language_code_map.items():
@@ -807,7 +922,18 @@ def validate_time_format(
         - Maximum 3 decimal places
         - Scientific notation is not allowed
         - String values must be convertible to Decimal
+        - Every issue has error_code "INVALID_TIME_FORMAT"
     """
+    # Fast path for plain numbers that are in range with at most 3 decimals;
+    # the exact Decimal checks below would find nothing for them
+    value_type = type(time_value)
+    if value_type is int:
+        if 0 <= time_value <= MAX_TIME_VALUE:
+            return []
+    elif value_type is float:
+        if 0 <= time_value <= MAX_TIME_VALUE and round(time_value, 3) == time_value:
+            return []
+
     issues = []
 
     try:
@@ -828,6 +954,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
             return issues
@@ -840,6 +967,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
             return issues
@@ -853,6 +981,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
             return issues
@@ -868,6 +997,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
             return issues
@@ -881,6 +1011,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
 
@@ -892,6 +1023,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
 
@@ -904,6 +1036,7 @@ def validate_time_format(
                     location=location,
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#time-format",
+                    error_code="INVALID_TIME_FORMAT",
                 )
             )
 
@@ -914,6 +1047,7 @@ def validate_time_format(
                 location=location,
                 severity=ValidationSeverity.ERROR,
                 spec_ref="#time-format",
+                error_code="INVALID_TIME_FORMAT",
             )
         )
 
@@ -955,31 +1089,140 @@ def validate_confidence_scores(
     if transcript is None:
         return issues
 
-    for idx, segment in enumerate(transcript.segments or []):
-        if segment.confidence is not None:
-            if not (0.0 <= segment.confidence <= 1.0):
-                issues.append(
-                    ValidationIssue(
-                        message=f"Segment confidence {segment.confidence} out of range [0.0, 1.0]",
-                        location=f"transcript.segments[{idx}].confidence",
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#segment-confidence",
-                    )
+    _walk_segments(transcript.segments or [], confidence_issues=issues)
+    return issues
+
+
+def _validate_segment_confidences(
+    segment: Segment, idx: int, issues: List[ValidationIssue]
+) -> None:
+    """Append range issues for the confidences of a segment and its words."""
+    if _is_out_of_range_confidence(segment.confidence):
+        issues.append(
+            ValidationIssue(
+                message=f"Segment confidence {segment.confidence} out of range [0.0, 1.0]",
+                location=f"transcript.segments[{idx}].confidence",
+                severity=ValidationSeverity.ERROR,
+                spec_ref="#segment-confidence",
+                error_code="CONFIDENCE_OUT_OF_RANGE",
+            )
+        )
+
+    if segment.words:
+        issues.extend(
+            [
+                ValidationIssue(
+                    message=f"Word confidence {word.confidence} out of range [0.0, 1.0]",
+                    location=f"transcript.segments[{idx}].words[{word_idx}].confidence",
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#word-confidence",
+                    error_code="CONFIDENCE_OUT_OF_RANGE",
                 )
+                for word_idx, word in enumerate(segment.words)
+                if _is_out_of_range_confidence(word.confidence)
+            ]
+        )
+
+
+def _is_out_of_range_confidence(value: Any) -> bool:
+    """Checks for a numeric confidence outside [0.0, 1.0].
+
+    None and non-numeric values return False; their types are reported by
+    validate_types().
+    """
+    return isinstance(value, (int, float, Decimal)) and not (0.0 <= value <= 1.0)
+
+
+@lru_cache(maxsize=None)
+def _jit_compile(kernel: Callable) -> Optional[Callable]:
+    """
+    Compile a NumPy loop kernel with Numba on first use.
+
+    Only called when USE_JIT is set. Numba is imported here rather than at
+    module import, since importing it costs more than most validations take.
+    Compiled kernels are cached on disk, in the package's __pycache__ or in
+    NUMBA_CACHE_DIR when that is set.
+
+    Args:
+        kernel (Callable): Loop version of a kernel, written for Numba
+
+    Returns:
+        Optional[Callable]: The compiled kernel, or None if Numba is not
+        installed
+    """
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - exercised when numba is absent
+        return None
+    return njit(cache=True)(kernel)
+
+
+def _screen_confidences(segments: List[Segment]) -> Optional[List[int]]:
+    """
+    Find the segments that may have confidence issues using NumPy.
+
+    All segment and word confidences are range-checked at once. Only the
+    returned segments need to go through the per-item checks.
+
+    Args:
+        segments: Segments to screen
+
+    Returns:
+        Optional[List[int]]: Sorted indices of segments with an out-of-range
+        confidence, or None when the fast path does not apply (NumPy
+        unavailable, few confidences or non-float/int values) and every
+        segment must be checked.
+    """
+    if np is None:
+        return None
 
-        for word_idx, word in enumerate(segment.words or []):
+    values = []
+    owners = []
+    for idx, segment in enumerate(segments):
+        if segment.confidence is not None:
+            values.append(segment.confidence)
+            owners.append(idx)
+        for word in segment.words or ():
             if word.confidence is not None:
-                if not (0.0 <= word.confidence <= 1.0):
-                    issues.append(
-                        ValidationIssue(
-                            message=f"Word confidence {word.confidence} out of range [0.0, 1.0]",
-                            location=f"transcript.segments[{idx}].words[{word_idx}].confidence",
-                            severity=ValidationSeverity.ERROR,
-                            spec_ref="#word-confidence",
-                        )
-                    )
+                values.append(word.confidence)
+                owners.append(idx)
 
-    return issues
+    if len(values) < NUMPY_MIN_WORDS:
+        return None
+    numeric_types = (int, float)
+    for value in values:
+        if type(value) not in numeric_types:
+            return None
+
+    try:
+        confidences = np.array(values, dtype=np.float64)
+    except OverflowError:
+        return None
+
+    out_of_range = _flag_confidences(confidences)
+    return np.unique(np.array(owners)[out_of_range]).tolist()
+
+
+def _flag_confidences_vectorized(confidences: "np.ndarray") -> "np.ndarray":
+    """Flag confidences outside [0.0, 1.0], including NaN."""
+    return ~((confidences >= 0.0) & (confidences <= 1.0))
+
+
+def _flag_confidences_loop(confidences: "np.ndarray") -> "np.ndarray":
+    """Single-pass equivalent of _flag_confidences_vectorized for Numba."""
+    out_of_range = np.zeros(confidences.size, dtype=np.bool_)
+    for i in range(confidences.size):
+        # NaN fails both comparisons and is flagged, as in the scalar check
+        out_of_range[i] = not (0.0 <= confidences[i] <= 1.0)
+    return out_of_range
+
+
+def _flag_confidences(confidences: "np.ndarray") -> "np.ndarray":
+    """Flag out-of-range confidences, JIT-compiled if USE_JIT is set."""
+    compiled = _jit_compile(_flag_confidences_loop) if USE_JIT else None
+    if compiled is None:
+        return _flag_confidences_vectorized(confidences)
+    return compiled(confidences)
 
 
 def validate_zero_duration(
@@ -1085,107 +1328,268 @@ def validate_segments(transcript: Transcript) -> List[ValidationIssue]:
         - Speaker and style references must be valid
     """
     issues = []
+    _walk_segments(transcript.segments or [], semantic_issues=issues)
+    return issues
 
-    segments = transcript.segments or []
-    previous_end = -1.0  # Initialize previous_end to a negative value
 
-    for idx, segment in enumerate(segments):
-        location = f"transcript.segments[{idx}]"
+def _screen_segment_timings(segments: List[Segment]) -> Optional[Set[int]]:
+    """
+    Find the segments that may have timing issues using vectorized NumPy checks.
 
-        # Check presence of 'start' and 'end'
-        has_start = segment.start is not None
-        has_end = segment.end is not None
+    Time format, zero duration and ordering against the previous segment are
+    checked for all segments at once. The time checks of every other segment
+    are known to pass and can be skipped.
 
-        if has_start != has_end:
+    Args:
+        segments: Segments to screen
+
+    Returns:
+        Optional[Set[int]]: Indices of suspicious segments, or None when the
+        fast path does not apply (NumPy unavailable, short list, untimed
+        segments, non-float/int values or any invalid time format) and every
+        segment must be checked.
+    """
+    if np is None or len(segments) < NUMPY_MIN_WORDS:
+        return None
+
+    numeric_types = (int, float)
+    for segment in segments:
+        if (
+            type(segment.start) not in numeric_types
+            or type(segment.end) not in numeric_types
+        ):
+            return None
+
+    try:
+        starts = np.array([segment.start for segment in segments], dtype=np.float64)
+        ends = np.array([segment.end for segment in segments], dtype=np.float64)
+    except OverflowError:
+        return None
+
+    # An invalid time changes which segment later ones are ordered against,
+    # so leave those transcripts to the per-segment checks
+    if not (_valid_time_mask(starts) & _valid_time_mask(ends)).all():
+        return None
+
+    # Explicitly flagged, zero-duration or reversed segments
+    suspicious = np.fromiter(
+        (bool(segment.is_zero_duration) for segment in segments),
+        dtype=bool,
+        count=len(segments),
+    )
+    suspicious |= starts >= ends
+    # Segments that start before the previous one ends
+    suspicious[1:] |= starts[1:] < ends[:-1]
+
+    return set(np.nonzero(suspicious)[0].tolist())
+
+
+def _validate_segment_semantics(
+    segment: Segment,
+    idx: int,
+    previous_end: float,
+    issues: List[ValidationIssue],
+    check_times: bool = True,
+    word_indices: Optional[List[int]] = None,
+) -> float:
+    """
+    Run the semantic checks of validate_segments for a single segment.
+
+    Args:
+        segment: Segment to validate
+        idx: Index of the segment in transcript.segments
+        previous_end: End time of the last segment with valid times
+        issues: List to append validation issues to
+        check_times: If False, the segment passed the timing pre-screen
+            (see _screen_segment_timings) and its time checks are skipped
+        word_indices: Indices of the words that failed the transcript-wide
+            word pre-screen (see _screen_transcript_words), or None if the
+            segment's words were not screened
+
+    Returns:
+        float: End time to compare the next segment against
+    """
+    location = f"transcript.segments[{idx}]"
+
+    if not check_times:
+        previous_end = segment.end
+        _validate_segment_content(segment, idx, location, issues, word_indices)
+        return previous_end
+
+    # Check presence of 'start' and 'end'
+    start = segment.start
+    end = segment.end
+    has_start = start is not None
+    has_end = end is not None
+
+    if has_start != has_end:
+        issues.append(
+            ValidationIssue(
+                message="If 'start' or 'end' is present, both must be present.",
+                location=location,
+                severity=ValidationSeverity.ERROR,
+                spec_ref="#segment-times",
+            )
+        )
+
+    if has_start and has_end:
+        # Validate time formats first
+        start_issues = validate_time_format(start, f"{location}.start")
+        end_issues = validate_time_format(end, f"{location}.end")
+        issues.extend(start_issues)
+        issues.extend(end_issues)
+
+        # Only proceed with other time-based validations if time formats are valid
+        if not start_issues and not end_issues:
+            # Validate zero-duration segments
+            issues.extend(
+                validate_zero_duration(start, end, segment.is_zero_duration, location)
+            )
+
+            # Check segment ordering and overlap
+            if idx > 0:
+                if start < previous_end:
+                    issues.append(
+                        ValidationIssue(
+                            message="Segments must not overlap and must be ordered by start time.",
+                            location=location,
+                            severity=ValidationSeverity.ERROR,
+                            spec_ref="#segment-ordering",
+                        )
+                    )
+                elif start == previous_end:
+                    # Segments can touch but not overlap
+                    pass
+                elif start < previous_end:
+                    issues.append(
+                        ValidationIssue(
+                            message="Segments must be ordered by start time.",
+                            location=location,
+                            severity=ValidationSeverity.ERROR,
+                            spec_ref="#segment-ordering",
+                        )
+                    )
+
+            previous_end = end
+
+    else:
+        # If 'start' and 'end' are absent, 'is_zero_duration' must not be present
+        if segment.is_zero_duration:
             issues.append(
                 ValidationIssue(
-                    message="If 'start' or 'end' is present, both must be present.",
+                    message="'is_zero_duration' must not be present when 'start' and 'end' are absent.",
                     location=location,
                     severity=ValidationSeverity.ERROR,
-                    spec_ref="#segment-times",
+                    spec_ref="#zero-duration",
                 )
             )
 
-        if has_start and has_end:
-            # Validate time formats first
-            start_issues = validate_time_format(segment.start, f"{location}.start")
-            end_issues = validate_time_format(segment.end, f"{location}.end")
-            issues.extend(start_issues)
-            issues.extend(end_issues)
-
-            # Only proceed with other time-based validations if time formats are valid
-            if not start_issues and not end_issues:
-                # Validate zero-duration segments
-                issues.extend(
-                    validate_zero_duration(
-                        segment.start, segment.end, segment.is_zero_duration, location
-                    )
-                )
+    _validate_segment_content(segment, idx, location, issues, word_indices)
 
-                # Check segment ordering and overlap
-                if idx > 0:
-                    if segment.start < previous_end:
-                        issues.append(
-                            ValidationIssue(
-                                message="Segments must not overlap and must be ordered by start time.",
-                                location=location,
-                                severity=ValidationSeverity.ERROR,
-                                spec_ref="#segment-ordering",
-                            )
-                        )
-                    elif segment.start == previous_end:
-                        # Segments can touch but not overlap
-                        pass
-                    elif segment.start < previous_end:
-                        issues.append(
-                            ValidationIssue(
-                                message="Segments must be ordered by start time.",
-                                location=location,
-                                severity=ValidationSeverity.ERROR,
-                                spec_ref="#segment-ordering",
-                            )
-                        )
+    return previous_end
 
-                previous_end = segment.end
 
-        else:
-            # If 'start' and 'end' are absent, 'is_zero_duration' must not be present
-            if segment.is_zero_duration:
-                issues.append(
-                    ValidationIssue(
-                        message="'is_zero_duration' must not be present when 'start' and 'end' are absent.",
-                        location=location,
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#zero-duration",
-                    )
-                )
+def _validate_segment_content(
+    segment: Segment,
+    idx: int,
+    location: str,
+    issues: List[ValidationIssue],
+    word_indices: Optional[List[int]] = None,
+) -> None:
+    """Validates the words, references and language of a single segment."""
+    # Validate words in segment
+    issues.extend(validate_words_in_segment(segment, idx, word_indices))
 
-        # Validate words in segment
-        issues.extend(validate_words_in_segment(segment, idx))
+    # Validate style_id if present
+    if segment.style_id is not None:
+        issues.extend(validate_style_id(segment.style_id, f"{location}.style_id"))
 
-        # Validate style_id if present
-        if segment.style_id is not None:
-            issues.extend(validate_style_id(segment.style_id, f"{location}.style_id"))
+    # Validate speaker_id if present
+    if segment.speaker_id is not None:
+        issues.extend(validate_speaker_id(segment.speaker_id, f"{location}.speaker_id"))
 
-        # Validate speaker_id if present
-        if segment.speaker_id is not None:
-            issues.extend(
-                validate_speaker_id(segment.speaker_id, f"{location}.speaker_id")
+    # Validate segment language
+    if segment.language:
+        issues.extend(validate_language_code(segment.language, f"{location}.language"))
+
+
+def _build_word_checker(
+    segment_location: str, issues: List[ValidationIssue]
+) -> Callable[[Word, int], None]:
+    """
+    Build the per-word timing checker used by validate_words_in_segment.
+
+    The segment location, the issues list methods and the validators are
+    bound once per segment so the word loop only does local lookups.
+
+    Args:
+        segment_location: Location of the segment in the STJ structure
+        issues: List the checker appends validation issues to
+
+    Returns:
+        Callable[[Word, int], None]: Checker called with each word and its index
+    """
+    append_issue = issues.append
+    extend_issues = issues.extend
+    words_location = f"{segment_location}.words"
+    check_time = validate_time_format
+    check_zero_duration = validate_zero_duration
+
+    def check_word(word: Word, word_idx: int) -> None:
+        word_location = f"{words_location}[{word_idx}]"
+        start = word.start
+        end = word.end
+
+        # Check presence of 'start' and 'end'
+        has_start = start is not None
+        has_end = end is not None
+
+        if has_start != has_end:
+            append_issue(
+                ValidationIssue(
+                    message="If 'start' or 'end' is present in a word, both must be present.",
+                    location=word_location,
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#word-timing",
+                )
             )
 
-        # Validate segment language
-        if segment.language:
-            issues.extend(
-                validate_language_code(segment.language, f"{location}.language")
+        if has_start and has_end:
+            # Validate time formats
+            extend_issues(check_time(start, f"{word_location}.start"))
+            extend_issues(check_time(end, f"{word_location}.end"))
+
+            # Validate zero-duration words; ordinary words (start < end, no
+            # flag) cannot produce a zero-duration issue, so skip the call
+            is_zero_duration = word.is_zero_duration
+            if is_zero_duration or not start < end:
+                extend_issues(
+                    check_zero_duration(start, end, is_zero_duration, word_location)
+                )
+        elif word.is_zero_duration:
+            # If 'start' and 'end' are absent, 'is_zero_duration' must not be present
+            append_issue(
+                ValidationIssue(
+                    message="'is_zero_duration' must not be present when 'start' and 'end' are absent in a word.",
+                    location=word_location,
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#zero-duration",
+                )
             )
 
-    return issues
+    return check_word
 
 
 def validate_words_in_segment(
-    segment: Segment, segment_idx: int
+    segment: Segment, segment_idx: int, word_indices: Optional[List[int]] = None
 ) -> List[ValidationIssue]:
-    """Validate words within a segment."""
+    """
+    Validate words within a segment.
+
+    word_indices may give the result of an earlier timing pre-screen of the
+    words (see _screen_transcript_words); otherwise the words are screened
+    here when the segment is long enough.
+    """
     issues = []
     words = segment.words or []
     location = f"transcript.segments[{segment_idx}]"
@@ -1215,9 +1619,8 @@ def validate_words_in_segment(
     # Convert and validate word_timing_mode
     word_timing_mode = segment.word_timing_mode
     if isinstance(word_timing_mode, str):
-        try:
-            word_timing_mode = WordTimingMode(word_timing_mode.lower())
-        except ValueError:
+        mode = _WORD_TIMING_MODES_BY_VALUE.get(word_timing_mode.lower())
+        if mode is None:
             issues.append(
                 ValidationIssue(
                     message=f"Invalid word_timing_mode '{word_timing_mode}'. Must be one of 'complete', 'partial', or 'none'.",
@@ -1227,6 +1630,7 @@ def validate_words_in_segment(
                 )
             )
             return issues
+        word_timing_mode = mode
 
     # Get the effective mode
     effective_word_timing_mode = word_timing_mode
@@ -1261,49 +1665,20 @@ def validate_words_in_segment(
                     )
                 )
 
-    # Validate individual words
-    for word_idx, word in enumerate(words):
-        word_location = f"{location}.words[{word_idx}]"
-
-        # Check presence of 'start' and 'end'
-        has_start = word.start is not None
-        has_end = word.end is not None
+    # Pre-screen long, fully timed word lists so that only suspicious words
+    # go through the per-word checks below
+    flagged_indices = word_indices
+    if flagged_indices is None:
+        flagged_indices = _screen_word_timings(segment, words)
+    word_indices = range(len(words)) if flagged_indices is None else flagged_indices
 
-        if has_start != has_end:
-            issues.append(
-                ValidationIssue(
-                    message="If 'start' or 'end' is present in a word, both must be present.",
-                    location=word_location,
-                    severity=ValidationSeverity.ERROR,
-                    spec_ref="#word-timing",
-                )
-            )
-
-        if has_start and has_end:
-            # Validate time formats
-            issues.extend(validate_time_format(word.start, f"{word_location}.start"))
-            issues.extend(validate_time_format(word.end, f"{word_location}.end"))
-
-            # Validate zero-duration words
-            issues.extend(
-                validate_zero_duration(
-                    word.start, word.end, word.is_zero_duration, word_location
-                )
-            )
-        else:
-            # If 'start' and 'end' are absent, 'is_zero_duration' must not be present
-            if word.is_zero_duration:
-                issues.append(
-                    ValidationIssue(
-                        message="'is_zero_duration' must not be present when 'start' and 'end' are absent in a word.",
-                        location=word_location,
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#zero-duration",
-                    )
-                )
+    # Validate individual words
+    check_word = _build_word_checker(location, issues)
+    for word_idx in word_indices:
+        check_word(words[word_idx], word_idx)
 
     # Validate word timings and order
-    issues.extend(_validate_word_timings(segment, segment_idx, words))
+    issues.extend(_validate_word_timings(segment, segment_idx, words, flagged_indices))
 
     # Validate word text consistency when effective mode is COMPLETE
     if effective_word_timing_mode == WordTimingMode.COMPLETE:
@@ -1369,9 +1744,8 @@ def _validate_word_timing_mode(
     if word_timing_mode is not None:
         # Convert string to WordTimingMode if necessary
         if isinstance(word_timing_mode, str):
-            try:
-                word_timing_mode = WordTimingMode(word_timing_mode.lower())
-            except ValueError:
+            mode = _WORD_TIMING_MODES_BY_VALUE.get(word_timing_mode.lower())
+            if mode is None:
                 issues.append(
                     ValidationIssue(
                         message=f"Invalid word_timing_mode '{word_timing_mode}'. Must be one of 'complete', 'partial', or 'none'.",
@@ -1381,6 +1755,7 @@ def _validate_word_timing_mode(
                     )
                 )
                 return issues
+            word_timing_mode = mode
         elif not isinstance(word_timing_mode, WordTimingMode):
             issues.append(
                 ValidationIssue(
@@ -1492,80 +1867,262 @@ def _determine_word_timing_mode(words: List[Word]) -> WordTimingStatus:
         return WordTimingStatus.INVALID
 
 
+def _screen_word_timings(segment: Segment, words: List[Word]) -> Optional[List[int]]:
+    """
+    Find the words that may have timing issues using vectorized NumPy checks.
+
+    Time format (range and precision), zero duration, segment boundaries and
+    word overlap are checked for all words at once. Only the returned indices
+    need to go through the per-word validators; every other word is known to
+    pass them.
+
+    Args:
+        segment: Segment containing the words
+        words: List of Word objects to screen
+
+    Returns:
+        Optional[List[int]]: Sorted indices of suspicious words, or None when
+        the fast path does not apply (NumPy unavailable, short list, untimed
+        words or non-float/int values) and every word must be checked.
+    """
+    if np is None or len(words) < NUMPY_MIN_WORDS:
+        return None
+
+    numeric_types = (int, float)
+    if type(segment.start) not in numeric_types and segment.start is not None:
+        return None
+    if type(segment.end) not in numeric_types and segment.end is not None:
+        return None
+
+    start_values = [word.start for word in words]
+    end_values = [word.end for word in words]
+    for value in start_values + end_values:
+        if type(value) not in numeric_types:
+            return None
+
+    try:
+        starts = np.array(start_values, dtype=np.float64)
+        ends = np.array(end_values, dtype=np.float64)
+    except OverflowError:
+        return None
+
+    # A value equal to its own rounding to 3 decimals within range is a
+    # valid time; anything else (including NaN/inf) is re-checked exactly
+    suspicious = ~_valid_time_mask(starts) | ~_valid_time_mask(ends)
+    # Explicitly flagged zero-duration words
+    suspicious |= np.fromiter(
+        (bool(word.is_zero_duration) for word in words), dtype=bool, count=len(words)
+    )
+    # Zero-duration/reversed words, segment boundaries and word overlap
+    suspicious |= _sweep_word_timings(
+        starts,
+        ends,
+        -math.inf if segment.start is None else float(segment.start),
+        math.inf if segment.end is None else float(segment.end),
+    )
+
+    return np.nonzero(suspicious)[0].tolist()
+
+
+def _screen_transcript_words(segments: List[Segment]) -> Optional[Dict[int, List[int]]]:
+    """
+    Screen the word timings of all segments at once using NumPy.
+
+    Runs the checks of _screen_word_timings over the words of every segment
+    in one pass, on flat start/end arrays with each word's segment bounds
+    repeated alongside. This also covers transcripts made of many short
+    segments, whose word lists are too short to be screened one by one.
+
+    Args:
+        segments: Segments whose words to screen
+
+    Returns:
+        Optional[Dict[int, List[int]]]: For each screened segment index, the
+        sorted indices of its suspicious words. Segments that could not be
+        screened (untimed or non-float/int values) are left out. None if
+        NumPy is unavailable or there are too few words to be worth it.
+    """
+    if np is None:
+        return None
+
+    numeric_types = (int, float)
+    screened = []  # (segment index, words) of segments that can be screened
+    start_values = []
+    end_values = []
+    segment_starts = []
+    segment_ends = []
+    for idx, segment in enumerate(segments):
+        words = segment.words
+        if not isinstance(words, list) or not words:
+            continue
+        if segment.start is not None and type(segment.start) not in numeric_types:
+            continue
+        if segment.end is not None and type(segment.end) not in numeric_types:
+            continue
+        starts = [word.start for word in words]
+        ends = [word.end for word in words]
+        if not all(type(value) in numeric_types for value in starts + ends):
+            continue
+        screened.append((idx, words))
+        start_values.extend(starts)
+        end_values.extend(ends)
+        segment_starts.append(-math.inf if segment.start is None else segment.start)
+        segment_ends.append(math.inf if segment.end is None else segment.end)
+
+    if len(start_values) < NUMPY_MIN_WORDS:
+        return None
+    try:
+        starts = np.array(start_values, dtype=np.float64)
+        ends = np.array(end_values, dtype=np.float64)
+        counts = np.array([len(words) for _, words in screened])
+        word_segment_starts = np.repeat(np.array(segment_starts, np.float64), counts)
+        word_segment_ends = np.repeat(np.array(segment_ends, np.float64), counts)
+    except OverflowError:
+        return None
+
+    # Offset of each segment's first word in the flat arrays
+    offsets = np.zeros(len(screened), dtype=np.intp)
+    np.cumsum(counts[:-1], out=offsets[1:])
+
+    suspicious = ~_valid_time_mask(starts) | ~_valid_time_mask(ends)
+    suspicious |= np.fromiter(
+        (bool(word.is_zero_duration) for _, words in screened for word in words),
+        dtype=bool,
+        count=starts.size,
+    )
+    suspicious |= starts >= ends
+    suspicious |= starts < word_segment_starts
+    suspicious |= ends > word_segment_ends
+    # Overlap with the previous word of the same segment
+    previous_ends = np.empty_like(ends)
+    previous_ends[1:] = ends[:-1]
+    previous_ends[offsets] = -np.inf
+    suspicious |= starts < previous_ends
+
+    flagged = np.nonzero(suspicious)[0]
+    owners = np.searchsorted(offsets, flagged, side="right") - 1
+    result = {idx: [] for idx, _ in screened}
+    for position, owner in zip(flagged.tolist(), owners.tolist()):
+        result[screened[owner][0]].append(position - int(offsets[owner]))
+    return result
+
+
+def _valid_time_mask(values: "np.ndarray") -> "np.ndarray":
+    """Vectorized counterpart of validate_time_format for float arrays."""
+    return (
+        (values >= 0)
+        & (values <= MAX_TIME_VALUE)
+        & (np.round(values * 1000) / 1000 == values)
+    )
+
+
+def _sweep_word_timings_vectorized(
+    starts: "np.ndarray", ends: "np.ndarray", segment_start: float, segment_end: float
+) -> "np.ndarray":
+    """Flag zero/negative duration, out-of-segment and overlapping words."""
+    suspicious = starts >= ends
+    suspicious |= starts < segment_start
+    suspicious |= ends > segment_end
+    suspicious[1:] |= starts[1:] < ends[:-1]
+    return suspicious
+
+
+def _sweep_word_timings_loop(
+    starts: "np.ndarray", ends: "np.ndarray", segment_start: float, segment_end: float
+) -> "np.ndarray":
+    """Single-pass equivalent of _sweep_word_timings_vectorized for Numba."""
+    suspicious = np.zeros(starts.size, dtype=np.bool_)
+    previous_end = -np.inf
+    for i in range(starts.size):
+        start = starts[i]
+        end = ends[i]
+        suspicious[i] = (
+            start >= end
+            or start < segment_start
+            or end > segment_end
+            or start < previous_end
+        )
+        previous_end = end
+    return suspicious
+
+
+def _sweep_word_timings(
+    starts: "np.ndarray", ends: "np.ndarray", segment_start: float, segment_end: float
+) -> "np.ndarray":
+    """Sweep word timings, JIT-compiled if USE_JIT is set and Numba is installed."""
+    compiled = _jit_compile(_sweep_word_timings_loop) if USE_JIT else None
+    if compiled is None:
+        return _sweep_word_timings_vectorized(starts, ends, segment_start, segment_end)
+    return compiled(starts, ends, segment_start, segment_end)
+
+
 def _validate_word_timings(
-    segment: Segment, segment_idx: int, words: List[Word]
+    segment: Segment,
+    segment_idx: int,
+    words: List[Word],
+    word_indices: Optional[List[int]] = None,
 ) -> List[ValidationIssue]:
     """
     Validate timing information for words within a segment.
+
+    When word_indices is given (see _screen_word_timings), all words are timed
+    and only those indices are checked. Time format and zero-duration checks
+    are done by validate_words_in_segment and are not repeated here.
     """
     issues = []
+    append_issue = issues.append
     previous_word_end = None
-
-    for word_idx, word in enumerate(words):
+    segment_start = segment.start
+    segment_end = segment.end
+    words_location = f"transcript.segments[{segment_idx}].words"
+    screened = word_indices is not None
+    if word_indices is None:
+        word_indices = range(len(words))
+
+    for word_idx in word_indices:
+        word = words[word_idx]
+        word_start = word.start
+        word_end = word.end
         # Skip timing validation if start/end are None
-        if word.start is None or word.end is None:
+        if word_start is None or word_end is None:
             continue
-
-        # Validate word time format
-        issues.extend(
-            validate_time_format(
-                word.start,
-                f"transcript.segments[{segment_idx}].words[{word_idx}].start",
-            )
-        )
-        issues.extend(
-            validate_time_format(
-                word.end, f"transcript.segments[{segment_idx}].words[{word_idx}].end"
-            )
-        )
-
-        # Validate zero-duration words
-        issues.extend(
-            validate_zero_duration(
-                word.start,
-                word.end,
-                word.is_zero_duration,
-                f"transcript.segments[{segment_idx}].words[{word_idx}]",
-            )
-        )
+        if screened and word_idx > 0:
+            previous_word_end = words[word_idx - 1].end
+        word_location = f"{words_location}[{word_idx}]"
 
         # Check if word timings are within segment boundaries
-        # Only compare if both values are not None
-        if word.start is not None and segment.start is not None:
-            if word.start < segment.start:
-                issues.append(
-                    ValidationIssue(
-                        message=f"Word start time ({word.start}) cannot be before segment start time ({segment.start})",
-                        location=f"transcript.segments[{segment_idx}].words[{word_idx}]",
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#word-timing",
-                    )
+        if segment_start is not None and word_start < segment_start:
+            append_issue(
+                ValidationIssue(
+                    message=f"Word start time ({word_start}) cannot be before segment start time ({segment_start})",
+                    location=word_location,
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#word-timing",
                 )
+            )
 
-        if word.end is not None and segment.end is not None:
-            if word.end > segment.end:
-                issues.append(
-                    ValidationIssue(
-                        message=f"Word end time ({word.end}) cannot be after segment end time ({segment.end})",
-                        location=f"transcript.segments[{segment_idx}].words[{word_idx}]",
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#word-timing",
-                    )
+        if segment_end is not None and word_end > segment_end:
+            append_issue(
+                ValidationIssue(
+                    message=f"Word end time ({word_end}) cannot be after segment end time ({segment_end})",
+                    location=word_location,
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#word-timing",
                 )
+            )
 
         # Check word ordering and overlap with previous word
-        if previous_word_end is not None:
-            if word.start < previous_word_end:
-                issues.append(
-                    ValidationIssue(
-                        message="Words within segment must not overlap in time",
-                        location=f"transcript.segments[{segment_idx}].words[{word_idx}]",
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#word-timing",
-                    )
+        if previous_word_end is not None and word_start < previous_word_end:
+            append_issue(
+                ValidationIssue(
+                    message="Words within segment must not overlap in time",
+                    location=word_location,
+                    severity=ValidationSeverity.ERROR,
+                    spec_ref="#word-timing",
                 )
+            )
 
-        previous_word_end = word.end
+        previous_word_end = word_end
 
     return issues
 
@@ -1581,11 +2138,16 @@ def _validate_word_text_consistency(
     issues = []
     concatenated_words = " ".join(word.text for word in words)
 
+    # Identical texts normalize identically, so only mismatches need the
+    # normalization below
+    if concatenated_words == segment.text:
+        return issues
+
     # Normalize texts by removing extra whitespace and punctuation
-    segment_text = re.sub(TEXT_NORMALIZATION_PATTERN, "", segment.text)
+    segment_text = TEXT_NORMALIZATION_RE.sub("", segment.text)
     segment_text = " ".join(segment_text.split())
 
-    words_text = re.sub(TEXT_NORMALIZATION_PATTERN, "", concatenated_words)
+    words_text = TEXT_NORMALIZATION_RE.sub("", concatenated_words)
     words_text = " ".join(words_text.split())
 
     # Perform case-insensitive comparison
@@ -1603,7 +2165,26 @@ def _validate_word_text_consistency(
             )
         )
 
-    return issues
+    return issues
+
+
+def _is_valid_id(value: Any, max_length: int = MAX_SPEAKER_ID_LENGTH) -> bool:
+    """Checks an ID against ^[A-Za-z0-9_-]{1,64}$ without the regex engine.
+
+    Unlike re.match with '$', a trailing newline is rejected.
+
+    Args:
+        value: ID to check
+        max_length: Maximum allowed length
+
+    Returns:
+        bool: True if value is a string of 1 to max_length allowed characters
+    """
+    return (
+        isinstance(value, str)
+        and 0 < len(value) <= max_length
+        and ID_CHARACTERS.issuperset(value)
+    )
 
 
 def validate_speaker_id(speaker_id: str, location: str) -> List[ValidationIssue]:
@@ -1639,7 +2220,7 @@ def validate_speaker_id(speaker_id: str, location: str) -> List[ValidationIssue]
     """
     issues = []
 
-    if not re.match(SPEAKER_ID_PATTERN, speaker_id):
+    if not _is_valid_id(speaker_id):
         issues.append(
             ValidationIssue(
                 message=f"Invalid 'speaker_id' format '{speaker_id}'. Must be 1 to {MAX_SPEAKER_ID_LENGTH} characters long, containing only letters, digits, underscores, or hyphens.",
@@ -1740,6 +2321,21 @@ def validate_transcript(transcript: Optional[Transcript]) -> List[ValidationIssu
         - Speakers and styles are optional but must be valid if present
         - All references (speaker_id, style_id) must be valid
     """
+    return _validate_transcript(transcript)
+
+
+def _validate_transcript(
+    transcript: Optional[Transcript],
+    segment_issues: Optional[List[ValidationIssue]] = None,
+) -> List[ValidationIssue]:
+    """
+    Implementation of validate_transcript.
+
+    Args:
+        transcript: Transcript object to validate
+        segment_issues: Issues from an earlier validate_segments walk (see
+            _walk_segments), used instead of walking the segments again
+    """
     issues = []
 
     if transcript is None:
@@ -1782,6 +2378,8 @@ def validate_transcript(transcript: Optional[Transcript]) -> List[ValidationIssu
                 spec_ref="#empty-array-rules",
             )
         )
+    elif segment_issues is not None:
+        issues.extend(segment_issues)
     else:
         issues.extend(validate_segments(transcript))
 
@@ -1796,10 +2394,60 @@ def validate_transcript(transcript: Optional[Transcript]) -> List[ValidationIssu
     return issues
 
 
+# Display names for the expected types used by the type validation helpers
+_TYPE_NAMES = {
+    int: "int",
+    float: "float",
+    str: "str",
+    dict: "dict",
+    bool: "bool",
+    (int, float): "int or float",
+    (str, WordTimingMode): "str or WordTimingMode",
+}
+
+
+def _type_name(expected_type: Union[Type, Tuple[Type, ...]]) -> str:
+    """Returns a display name for a type or tuple of types.
+
+    Args:
+        expected_type: Type or tuple of types passed to isinstance()
+
+    Returns:
+        str: Type name, with tuple members joined by " or "
+    """
+    name = _TYPE_NAMES.get(expected_type)
+    if name is None:
+        if isinstance(expected_type, tuple):
+            name = " or ".join(t.__name__ for t in expected_type)
+        else:
+            name = getattr(expected_type, "__name__", repr(expected_type))
+    return name
+
+
+def _field_location(base_location: str, field_name: Optional[str]) -> str:
+    """Builds the location of a field for error reporting.
+
+    The type helpers below take the parent location and the field name
+    separately and only call this when they actually report an issue, so
+    valid input does not pay for formatting location strings.
+
+    Args:
+        base_location: Path of the parent object in the STJ structure
+        field_name: Name of the field, or None if base_location is the field
+
+    Returns:
+        str: "<base_location>.<field_name>", or base_location if no field name
+    """
+    if field_name is None:
+        return base_location
+    return f"{base_location}.{field_name}"
+
+
 def _validate_optional_field(
     value: Any,
     expected_type: Type,
-    location: str,
+    base_location: str,
+    field_name: Optional[str],
     issues: List[ValidationIssue],
     severity: ValidationSeverity = ValidationSeverity.ERROR,
     spec_ref: Optional[str] = None,
@@ -1811,7 +2459,8 @@ def _validate_optional_field(
     Args:
         value: The value to validate
         expected_type: Type or tuple of types that are valid
-        location: Path in STJ structure for error reporting
+        base_location: Path of the parent object in STJ structure
+        field_name: Name of the field within the parent object
         issues: List to append validation issues to
         severity: Severity level for validation issues
         spec_ref: Reference to relevant specification section
@@ -1822,9 +2471,10 @@ def _validate_optional_field(
         - For numeric types, Decimal is accepted where float/int is expected
     """
     if value is not None and not isinstance(value, expected_type):
+        location = _field_location(base_location, field_name)
         issues.append(
             ValidationIssue(
-                message=f"Field {location} must be of type {expected_type.__name__} if present",
+                message=f"Field {location} must be of type {_type_name(expected_type)} if present",
                 location=location,
                 severity=severity,
                 spec_ref=spec_ref,
@@ -1859,7 +2509,8 @@ def _validate_list_field(
     Note:
         - Validates both list structure and individual items
         - Empty lists are allowed by default
-        - Item validator is called for each item with index
+        - Item validator is called for each item with index and appends to a
+          local list that is merged into issues after the loop
     """
     if not isinstance(items, list):
         issues.append(
@@ -1882,8 +2533,12 @@ def _validate_list_field(
             )
         )
 
+    # Collect item issues locally and add them to the caller's list once
+    item_issues: List[ValidationIssue] = []
     for idx, item in enumerate(items):
-        item_validator(item, idx, location, issues)
+        item_validator(item, idx, location, item_issues)
+    if item_issues:
+        issues.extend(item_issues)
 
 
 def _check_unexpected_fields(
@@ -1900,10 +2555,11 @@ def _check_unexpected_fields(
         List of validation issues found
     """
     issues = []
-    obj_dict = asdict(obj)
+    # Only the field names are needed, so read them from the dataclass
+    # definition instead of recursively copying the object with asdict()
     # Exclude internal fields (starting with underscore) from validation
     unexpected_fields = {
-        k for k in obj_dict.keys() if not k.startswith("_")
+        f.name for f in fields(obj) if not f.name.startswith("_")
     } - expected_fields
     if unexpected_fields:
         issues.append(
@@ -1920,7 +2576,8 @@ def _check_unexpected_fields(
 def _validate_required_field(
     value,
     expected_type,
-    location,
+    base_location,
+    field_name,
     issues,
     severity=ValidationSeverity.ERROR,
     spec_ref=None,
@@ -1930,12 +2587,14 @@ def _validate_required_field(
     Args:
         value: The value to validate
         expected_type: Type or tuple of types that are valid
-        location: Location in STJ structure for error reporting
+        base_location: Location of the parent object in STJ structure
+        field_name: Name of the field within the parent object
         issues: List to append validation issues to
         severity: Severity level for validation issues
         spec_ref: Reference to relevant specification section
     """
     if value is None:
+        location = _field_location(base_location, field_name)
         issues.append(
             ValidationIssue(
                 message=f"Missing required field: {location}",
@@ -1952,16 +2611,10 @@ def _validate_required_field(
     ):
         return  # Accept Decimal as valid
     elif not isinstance(value, expected_type):
-        type_names = (
-            [expected_type.__name__]
-            if hasattr(expected_type, "__name__")
-            else [t.__name__ for t in expected_type]
-        )
-        type_str = " or ".join(type_names)
-
+        location = _field_location(base_location, field_name)
         issues.append(
             ValidationIssue(
-                message=f"Field {location} must be of type {type_str}",
+                message=f"Field {location} must be of type {_type_name(expected_type)}",
                 location=location,
                 severity=severity,
                 spec_ref=spec_ref,
@@ -1970,9 +2623,16 @@ def _validate_required_field(
 
 
 def _validate_non_empty_string(
-    value, location, issues, required, severity=ValidationSeverity.ERROR, spec_ref=None
+    value,
+    base_location,
+    field_name,
+    issues,
+    required,
+    severity=ValidationSeverity.ERROR,
+    spec_ref=None,
 ):
     if required and not value:
+        location = _field_location(base_location, field_name)
         issues.append(
             ValidationIssue(
                 message=f"Field {location} is required and must be a non-empty string",
@@ -1982,6 +2642,7 @@ def _validate_non_empty_string(
             )
         )
     elif value is not None and (not isinstance(value, str) or not value.strip()):
+        location = _field_location(base_location, field_name)
         issues.append(
             ValidationIssue(
                 message=f"Field {location} must be a non-empty string",
@@ -2020,14 +2681,16 @@ def _validate_speaker(
     _validate_required_field(
         speaker.id,
         str,
-        f"{location}.id",
+        location,
+        "id",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#speaker-id",
     )
     _validate_non_empty_string(
         speaker.id,
-        f"{location}.id",
+        location,
+        "id",
         issues,
         required=True,
         severity=ValidationSeverity.ERROR,
@@ -2038,14 +2701,16 @@ def _validate_speaker(
     _validate_optional_field(
         speaker.name,
         str,
-        f"{location}.name",
+        location,
+        "name",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#speaker-name",
     )
     _validate_non_empty_string(
         speaker.name,
-        f"{location}.name",
+        location,
+        "name",
         issues,
         required=False,
         severity=ValidationSeverity.ERROR,
@@ -2056,7 +2721,8 @@ def _validate_speaker(
     _validate_optional_field(
         speaker.extensions,
         dict,
-        f"{location}.extensions",
+        location,
+        "extensions",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#extensions-field",
@@ -2091,20 +2757,22 @@ def _validate_style(
     _validate_required_field(
         style.id,
         str,
-        f"{location}.id",
+        location,
+        "id",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#style-id",
     )
     _validate_non_empty_string(
         style.id,
-        f"{location}.id",
+        location,
+        "id",
         issues,
         required=True,
         severity=ValidationSeverity.ERROR,
         spec_ref="#style-id",
     )
-    if style.id is not None and not re.match(r"^[A-Za-z0-9_-]{1,64}$", style.id):
+    if isinstance(style.id, str) and not _is_valid_id(style.id):
         issues.append(
             ValidationIssue(
                 message=f"Invalid style ID format: {style.id}. Must contain only letters, digits, underscores, or hyphens, with length between 1 and 64 characters.",
@@ -2118,7 +2786,8 @@ def _validate_style(
     _validate_optional_field(
         style.text,
         dict,
-        f"{location}.text",
+        location,
+        "text",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#style-text",
@@ -2127,7 +2796,8 @@ def _validate_style(
     _validate_optional_field(
         style.display,
         dict,
-        f"{location}.display",
+        location,
+        "display",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#style-display",
@@ -2136,7 +2806,8 @@ def _validate_style(
     _validate_optional_field(
         style.extensions,
         dict,
-        f"{location}.extensions",
+        location,
+        "extensions",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#extensions-field",
@@ -2173,14 +2844,16 @@ def _validate_word(
     _validate_required_field(
         word.text,
         str,
-        f"{location}.text",
+        location,
+        "text",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#word-text",
     )
     _validate_non_empty_string(
         word.text,
-        f"{location}.text",
+        location,
+        "text",
         issues,
         required=True,
         severity=ValidationSeverity.ERROR,
@@ -2204,7 +2877,8 @@ def _validate_word(
             _validate_required_field(
                 word.start,
                 (int, float),
-                f"{location}.start",
+                location,
+                "start",
                 issues,
                 severity=ValidationSeverity.ERROR,
                 spec_ref="#word-start-end",
@@ -2212,7 +2886,8 @@ def _validate_word(
             _validate_required_field(
                 word.end,
                 (int, float),
-                f"{location}.end",
+                location,
+                "end",
                 issues,
                 severity=ValidationSeverity.ERROR,
                 spec_ref="#word-start-end",
@@ -2222,7 +2897,8 @@ def _validate_word(
     _validate_optional_field(
         word.confidence,
         (int, float),
-        f"{location}.confidence",
+        location,
+        "confidence",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#word-confidence",
@@ -2232,7 +2908,8 @@ def _validate_word(
     _validate_optional_field(
         word.extensions,
         dict,
-        f"{location}.extensions",
+        location,
+        "extensions",
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#extensions-field",
@@ -2260,18 +2937,21 @@ def _validate_language(
         - Must be a non-empty string
         - Case sensitive according to ISO standards
     """
+    item_location = f"{location}[{idx}]"
     # First validate type and non-emptiness
     _validate_optional_field(
         lang,
         str,
-        f"{location}[{idx}]",
+        item_location,
+        None,
         issues,
         severity=ValidationSeverity.ERROR,
         spec_ref="#language-codes",
     )
     _validate_non_empty_string(
         lang,
-        f"{location}[{idx}]",
+        item_location,
+        None,
         issues,
         required=True,
         severity=ValidationSeverity.ERROR,
@@ -2280,10 +2960,221 @@ def _validate_language(
 
     # Then validate the language code itself
     if lang is not None:
-        issues.extend(validate_language_code(lang, f"{location}[{idx}]"))
+        issues.extend(validate_language_code(lang, item_location))
+
+
+def _validate_segment_types(
+    segment: Optional[Segment], idx: int, issues: List[ValidationIssue]
+) -> None:
+    """
+    Run the type checks of validate_types for a single segment and its words.
+
+    Args:
+        segment: Segment to validate
+        idx: Index of the segment in transcript.segments
+        issues: List to append validation issues to
+    """
+    location = f"transcript.segments[{idx}]"
+    if segment is None:
+        issues.append(
+            ValidationIssue(
+                message=f"{location} cannot be None",
+                location=location,
+                severity=ValidationSeverity.ERROR,
+                spec_ref="#segments-array",
+            )
+        )
+        return
+
+    # Check for unexpected fields in segment
+    issues.extend(
+        _check_unexpected_fields(
+            segment, {field.name for field in fields(Segment)}, location
+        )
+    )
+
+    # Required field: 'text'
+    _validate_non_empty_string(
+        segment.text,
+        location,
+        "text",
+        issues,
+        required=True,
+    )
+
+    # Optional fields: 'start' and 'end' must be both present or both absent
+    has_start = segment.start is not None
+    has_end = segment.end is not None
+    if has_start != has_end:
+        issues.append(
+            ValidationIssue(
+                message="If 'start' or 'end' is present, both must be present.",
+                location=location,
+                severity=ValidationSeverity.ERROR,
+                spec_ref="#segment-times",
+            )
+        )
+    else:
+        # Validate 'start' and 'end' if present
+        if has_start and has_end:
+            _validate_required_field(
+                segment.start, (int, float), location, "start", issues
+            )
+            _validate_required_field(segment.end, (int, float), location, "end", issues)
+
+    # Optional fields
+    _validate_optional_field(
+        segment.confidence,
+        (int, float),
+        location,
+        "confidence",
+        issues,
+    )
+    _validate_optional_field(
+        segment.word_timing_mode,
+        (str, WordTimingMode),
+        location,
+        "word_timing_mode",
+        issues,
+    )
+    _validate_optional_field(
+        segment.is_zero_duration,
+        bool,
+        location,
+        "is_zero_duration",
+        issues,
+    )
+    _validate_optional_field(
+        segment.extensions,
+        dict,
+        location,
+        "extensions",
+        issues,
+    )
+
+    # Optional string fields with empty check
+    _validate_non_empty_string(
+        segment.speaker_id,
+        location,
+        "speaker_id",
+        issues,
+        required=False,
+    )
+    _validate_non_empty_string(
+        segment.style_id,
+        location,
+        "style_id",
+        issues,
+        required=False,
+    )
+    _validate_non_empty_string(
+        segment.language,
+        location,
+        "language",
+        issues,
+        required=False,
+    )
+
+    # Validate words in segment
+    if segment.words is not None:
+        _validate_list_field(
+            segment.words,
+            f"{location}.words",
+            issues,
+            _validate_word,
+            "words",
+            allow_empty=False,
+        )
+        for word_idx, word in enumerate(segment.words):
+            word_location = f"{location}.words[{word_idx}]"
+            if word is None:
+                issues.append(
+                    ValidationIssue(
+                        message=f"{word_location} cannot be None",
+                        location=word_location,
+                        severity=ValidationSeverity.ERROR,
+                        spec_ref="#words-array",
+                    )
+                )
+                continue
+            # Check for unexpected fields in word
+            issues.extend(
+                _check_unexpected_fields(
+                    word, {field.name for field in fields(Word)}, word_location
+                )
+            )
+
+
+def _walk_segments(
+    segments: List[Segment],
+    type_issues: Optional[List[ValidationIssue]] = None,
+    semantic_issues: Optional[List[ValidationIssue]] = None,
+    language_issues: Optional[List[ValidationIssue]] = None,
+    confidence_issues: Optional[List[ValidationIssue]] = None,
+    languages: Optional[List[Tuple[str, str]]] = None,
+) -> None:
+    """
+    Walk the segments once, running the requested per-segment checks on each.
+
+    Each list collects the per-segment part of one validator:
+
+    * type_issues: validate_types
+    * semantic_issues: validate_segments
+    * language_issues: validate_language_codes
+    * confidence_issues: validate_confidence_scores
+    * languages: the (location, code) pairs of segment languages tracked by
+      validate_language_consistency
+
+    A check is skipped when its list is None, and each list receives entries
+    in the same order as the standalone validator would report them.
+
+    Args:
+        segments: Segments to validate
+        type_issues: List for type issues, or None to skip type checks
+        semantic_issues: List for semantic issues, or None to skip them
+        language_issues: List for language code issues, or None to skip them
+        confidence_issues: List for confidence issues, or None to skip them
+        languages: List for segment languages, or None to skip collecting them
+    """
+    previous_end = -1.0  # Initialize previous_end to a negative value
+    flagged_timings = flagged_confidences = None
+    screened_words = {}
+    if semantic_issues is not None:
+        flagged_timings = _screen_segment_timings(segments)
+        screened_words = _screen_transcript_words(segments) or {}
+    if confidence_issues is not None:
+        # Pre-screen large transcripts so that only segments with an
+        # out-of-range confidence (on the segment or a word) are checked
+        flagged_confidences = _screen_confidences(segments)
+        if flagged_confidences is not None:
+            flagged_confidences = set(flagged_confidences)
+    for idx, segment in enumerate(segments):
+        if semantic_issues is not None:
+            previous_end = _validate_segment_semantics(
+                segment,
+                idx,
+                previous_end,
+                semantic_issues,
+                check_times=flagged_timings is None or idx in flagged_timings,
+                word_indices=screened_words.get(idx),
+            )
+        if type_issues is not None:
+            _validate_segment_types(segment, idx, type_issues)
+        if (language_issues is not None or languages is not None) and segment.language:
+            location = f"transcript.segments[{idx}].language"
+            if language_issues is not None:
+                language_issues.extend(
+                    validate_language_code(segment.language, location)
+                )
+            if languages is not None:
+                languages.append((location, segment.language))
+        if confidence_issues is not None and (
+            flagged_confidences is None or idx in flagged_confidences
+        ):
+            _validate_segment_confidences(segment, idx, confidence_issues)
 
 
-def validate_types(stj: STJ) -> List[ValidationIssue]:
+def validate_types(stj: STJ, fail_fast: bool = False) -> List[ValidationIssue]:
     """Validates types and required fields in STJ data structure.
 
     Performs comprehensive type validation throughout the STJ structure:
@@ -2295,6 +3186,9 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
 
     Args:
         stj (STJ): The STJ object containing version, transcript, and optional metadata
+        fail_fast (bool): If True, stop after the first group of checks (root
+            fields, transcript lists, segments) that reports any issue instead
+            of walking the rest of the structure
 
     Returns:
         List[ValidationIssue]: List of validation issues found. Empty list if all valid.
@@ -2312,6 +3206,23 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
         - Ensures correct array types for lists
         - Validates nested object structures
     """
+    return _validate_types(stj, fail_fast)
+
+
+def _validate_types(
+    stj: STJ,
+    fail_fast: bool = False,
+    segment_issues: Optional[List[ValidationIssue]] = None,
+) -> List[ValidationIssue]:
+    """
+    Implementation of validate_types.
+
+    Args:
+        stj: The STJ object to validate
+        fail_fast: See validate_types
+        segment_issues: Segment type issues from an earlier walk (see
+            _walk_segments), used instead of walking the segments again
+    """
     issues = []
 
     # Validate STJ root
@@ -2356,6 +3267,8 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             transcript, {field.name for field in fields(Transcript)}, "transcript"
         )
     )
+    if issues and fail_fast:
+        return issues
 
     # Validate transcript speakers
     if transcript.speakers is not None:
@@ -2377,6 +3290,8 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             _validate_style,
             "styles",
         )
+    if issues and fail_fast:
+        return issues
 
     # Validate transcript segments
     if transcript.segments is None:
@@ -2388,131 +3303,13 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
                 spec_ref="#segments-field",
             )
         )
+    elif segment_issues is not None:
+        issues.extend(segment_issues)
     else:
-        for idx, segment in enumerate(transcript.segments):
-            location = f"transcript.segments[{idx}]"
-            if segment is None:
-                issues.append(
-                    ValidationIssue(
-                        message=f"{location} cannot be None",
-                        location=location,
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#segments-array",
-                    )
-                )
-                continue
-
-            # Check for unexpected fields in segment
-            issues.extend(
-                _check_unexpected_fields(
-                    segment, {field.name for field in fields(Segment)}, location
-                )
-            )
-
-            # Required field: 'text'
-            _validate_non_empty_string(
-                segment.text,
-                f"{location}.text",
-                issues,
-                required=True,
-            )
-
-            # Optional fields: 'start' and 'end' must be both present or both absent
-            has_start = segment.start is not None
-            has_end = segment.end is not None
-            if has_start != has_end:
-                issues.append(
-                    ValidationIssue(
-                        message="If 'start' or 'end' is present, both must be present.",
-                        location=location,
-                        severity=ValidationSeverity.ERROR,
-                        spec_ref="#segment-times",
-                    )
-                )
-            else:
-                # Validate 'start' and 'end' if present
-                if has_start and has_end:
-                    _validate_required_field(
-                        segment.start, (int, float), f"{location}.start", issues
-                    )
-                    _validate_required_field(
-                        segment.end, (int, float), f"{location}.end", issues
-                    )
-
-            # Optional fields
-            _validate_optional_field(
-                segment.confidence,
-                (int, float),
-                f"{location}.confidence",
-                issues,
-            )
-            _validate_optional_field(
-                segment.word_timing_mode,
-                (str, WordTimingMode),
-                f"{location}.word_timing_mode",
-                issues,
-            )
-            _validate_optional_field(
-                segment.is_zero_duration,
-                bool,
-                f"{location}.is_zero_duration",
-                issues,
-            )
-            _validate_optional_field(
-                segment.extensions,
-                dict,
-                f"{location}.extensions",
-                issues,
-            )
-
-            # Optional string fields with empty check
-            _validate_non_empty_string(
-                segment.speaker_id,
-                f"{location}.speaker_id",
-                issues,
-                required=False,
-            )
-            _validate_non_empty_string(
-                segment.style_id,
-                f"{location}.style_id",
-                issues,
-                required=False,
-            )
-            _validate_non_empty_string(
-                segment.language,
-                f"{location}.language",
-                issues,
-                required=False,
-            )
+        _walk_segments(transcript.segments, type_issues=issues)
 
-            # Validate words in segment
-            if segment.words is not None:
-                _validate_list_field(
-                    segment.words,
-                    f"{location}.words",
-                    issues,
-                    _validate_word,
-                    "words",
-                    allow_empty=False,
-                )
-                for word_idx, word in enumerate(segment.words):
-                    word_location = f"{location}.words[{word_idx}]"
-                    if word is None:
-                        issues.append(
-                            ValidationIssue(
-                                message=f"{word_location} cannot be None",
-                                location=word_location,
-                                severity=ValidationSeverity.ERROR,
-                                spec_ref="#words-array",
-                            )
-                        )
-                        continue
-                    # Check for unexpected fields in word
-                    issues.extend(
-                        _check_unexpected_fields(
-                            word, {field.name for field in fields(Word)}, word_location
-                        )
-                    )
+    if issues and fail_fast:
+        return issues
 
     # Validate metadata if present
     metadata = stj.metadata
@@ -2525,6 +3322,7 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
                     location="metadata",
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#metadata-section",
+                    error_code="INVALID_STRUCTURE",
                 )
             )
             return issues
@@ -2536,6 +3334,7 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
                     location="metadata",
                     severity=ValidationSeverity.ERROR,
                     spec_ref="#metadata-section",
+                    error_code="INVALID_STRUCTURE",
                 )
             )
             return issues
@@ -2549,6 +3348,7 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
                         location="metadata.transcriber",
                         severity=ValidationSeverity.ERROR,
                         spec_ref="#metadata-section",
+                        error_code="INVALID_STRUCTURE",
                     )
                 )
                 return issues
@@ -2575,7 +3375,8 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             if metadata.transcriber.name is not None:
                 _validate_non_empty_string(
                     metadata.transcriber.name,
-                    f"{transcriber_location}.name",
+                    transcriber_location,
+                    "name",
                     issues,
                     required=False,
                     severity=ValidationSeverity.ERROR,
@@ -2586,7 +3387,8 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             if metadata.transcriber.version is not None:
                 _validate_non_empty_string(
                     metadata.transcriber.version,
-                    f"{transcriber_location}.version",
+                    transcriber_location,
+                    "version",
                     issues,
                     required=False,
                     severity=ValidationSeverity.ERROR,
@@ -2618,12 +3420,13 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             )
             # Optional fields
             _validate_optional_field(
-                metadata.source.uri, str, f"{source_location}.uri", issues
+                metadata.source.uri, str, source_location, "uri", issues
             )
             _validate_optional_field(
                 metadata.source.duration,
                 (int, float),
-                f"{source_location}.duration",
+                source_location,
+                "duration",
                 issues,
             )
             if metadata.source.languages is not None:
@@ -2638,7 +3441,8 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
             _validate_optional_field(
                 metadata.source.extensions,
                 dict,
-                f"{source_location}.extensions",
+                source_location,
+                "extensions",
                 issues,
             )
 
@@ -2655,16 +3459,71 @@ def validate_types(stj: STJ) -> List[ValidationIssue]:
         _validate_optional_field(
             metadata.confidence_threshold,
             (int, float),
-            "metadata.confidence_threshold",
+            "metadata",
+            "confidence_threshold",
             issues,
         )
         _validate_optional_field(
-            metadata.extensions, dict, "metadata.extensions", issues
+            metadata.extensions, dict, "metadata", "extensions", issues
         )
 
     return issues
 
 
+def _check_style_boolean(key: str, value: Any) -> Optional[str]:
+    """Checks a boolean style text property (bold, italic, underline)."""
+    if not isinstance(value, bool):
+        return f"Invalid {key} value: {value}. Must be a boolean"
+    return None
+
+
+def _check_style_color(key: str, value: Any) -> Optional[str]:
+    """Checks a #RRGGBB style color property (color, background)."""
+    if not isinstance(value, str) or not COLOR_RE.fullmatch(value):
+        return f"Invalid color format for {key}: {value}. Must be in #RRGGBB format"
+    return None
+
+
+def _check_style_percentage(key: str, value: Any) -> Optional[str]:
+    """Checks that a style property is a percentage string such as '80%'."""
+    if not isinstance(value, str) or not PERCENTAGE_RE.fullmatch(value):
+        return f"Invalid {key} format: {value}. Must be percentage (e.g., '80%')"
+    return None
+
+
+def _check_style_size(key: str, value: Any) -> Optional[str]:
+    """Checks the 'size' style property (percentage greater than 0%)."""
+    error = _check_style_percentage(key, value)
+    if error is None and int(value[:-1]) <= 0:
+        error = f"'size' must be greater than 0%, got {value}"
+    return error
+
+
+def _check_style_opacity(key: str, value: Any) -> Optional[str]:
+    """Checks the 'opacity' style property (percentage from 0% to 100%)."""
+    error = _check_style_percentage(key, value)
+    if error is None and not (0 <= int(value[:-1]) <= 100):
+        error = f"'opacity' must be between 0% and 100%, got {value}"
+    return error
+
+
+# Checker for each valid style text property; each returns an error message
+# or None
+_STYLE_TEXT_VALIDATORS: Dict[str, Callable[[str, Any], Optional[str]]] = {
+    "bold": _check_style_boolean,
+    "italic": _check_style_boolean,
+    "underline": _check_style_boolean,
+    "color": _check_style_color,
+    "background": _check_style_color,
+    "size": _check_style_size,
+    "opacity": _check_style_opacity,
+}
+
+# Style text properties allowed by the specification, derived from the
+# checkers so the two cannot drift apart
+VALID_TEXT_PROPERTIES = frozenset(_STYLE_TEXT_VALIDATORS)
+
+
 def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
     """Validates style format according to STJ specification.
 
@@ -2699,7 +3558,6 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
     if transcript.styles is None:
         return issues
 
-    style_ids = set()
     style_ids = set()
     for idx, style in enumerate(transcript.styles):
         # Validate style ID uniqueness
@@ -2716,14 +3574,6 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
 
         # Validate text properties
         if style.text:
-            if not style.text:  # Empty dictionary check
-                issues.append(
-                    ValidationIssue(
-                        message="Style text dictionary cannot be empty",
-                        location=f"transcript.styles[{idx}].text",
-                    )
-                )
-
             for key, value in style.text.items():
                 if value is None:
                     issues.append(
@@ -2734,7 +3584,8 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
                     )
                     continue
 
-                if key not in VALID_TEXT_PROPERTIES:
+                checker = _STYLE_TEXT_VALIDATORS.get(key)
+                if checker is None:
                     issues.append(
                         ValidationIssue(
                             message=f"Invalid text property: {key}",
@@ -2743,73 +3594,25 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
                     )
                     continue
 
-                # Validate property values based on type
-                if key in {"bold", "italic", "underline"}:
-                    if not isinstance(value, bool):
-                        issues.append(
-                            ValidationIssue(
-                                message=f"Invalid {key} value: {value}. Must be a boolean",
-                                location=f"transcript.styles[{idx}].text.{key}",
-                            )
-                        )
-
-                # Validate color format
-                elif key in {"color", "background"}:
-                    if not isinstance(value, str) or not re.match(
-                        r"^#[0-9A-Fa-f]{6}$", value
-                    ):
-                        issues.append(
-                            ValidationIssue(
-                                message=f"Invalid color format for {key}: {value}. Must be in #RRGGBB format",
-                                location=f"transcript.styles[{idx}].text.{key}",
-                            )
-                        )
-
-                # Validate percentage values
-                elif key in {"size", "opacity"}:
-                    if not isinstance(value, str) or not re.match(r"^\d+%$", value):
-                        issues.append(
-                            ValidationIssue(
-                                message=f"Invalid {key} format: {value}. Must be percentage (e.g., '80%')",
-                                location=f"transcript.styles[{idx}].text.{key}",
-                            )
-                        )
-                        continue
-
-                    # Additional validation for size and opacity values
-                    percent_value = int(value.rstrip("%"))
-                    if key == "size" and percent_value <= 0:
-                        issues.append(
-                            ValidationIssue(
-                                message=f"'size' must be greater than 0%, got {value}",
-                                location=f"transcript.styles[{idx}].text.size",
-                            )
-                        )
-                    elif key == "opacity" and not (0 <= percent_value <= 100):
-                        issues.append(
-                            ValidationIssue(
-                                message=f"'opacity' must be between 0% and 100%, got {value}",
-                                location=f"transcript.styles[{idx}].text.opacity",
-                            )
+                # Validate property value with the checker for this property
+                error = checker(key, value)
+                if error:
+                    issues.append(
+                        ValidationIssue(
+                            message=error,
+                            location=f"transcript.styles[{idx}].text.{key}",
                         )
+                    )
 
         # Validate display properties - skip type checking as it's done in validate_types()
         if style.display:
-            if not style.display:  # Empty dictionary check
-                issues.append(
-                    ValidationIssue(
-                        message="Style display dictionary cannot be empty",
-                        location=f"transcript.styles[{idx}].display",
-                    )
-                )
-
             # Validate align property
             if "align" in style.display:
                 align_value = style.display["align"]
                 if align_value not in VALID_ALIGN_VALUES:
                     issues.append(
                         ValidationIssue(
-                            message=f"Invalid align value: {align_value}. Must be one of: {', '.join(VALID_ALIGN_VALUES)}",
+                            message=f"Invalid align value: {align_value}. Must be one of: {_ALIGN_VALUES_TEXT}",
                             location=f"transcript.styles[{idx}].display.align",
                         )
                     )
@@ -2820,7 +3623,7 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
                 if vertical_value not in VALID_VERTICAL_VALUES:
                     issues.append(
                         ValidationIssue(
-                            message=f"Invalid vertical value: {vertical_value}. Must be one of: {', '.join(VALID_VERTICAL_VALUES)}",
+                            message=f"Invalid vertical value: {vertical_value}. Must be one of: {_VERTICAL_VALUES_TEXT}",
                             location=f"transcript.styles[{idx}].display.vertical",
                         )
                     )
@@ -2845,7 +3648,7 @@ def validate_styles(transcript: Transcript) -> List[ValidationIssue]:
                                         location=f"transcript.styles[{idx}].display.position.{coord}",
                                     )
                                 )
-                            elif not re.match(r"^\d+%$", pos[coord]):
+                            elif not PERCENTAGE_RE.fullmatch(pos[coord]):
                                 issues.append(
                                     ValidationIssue(
                                         message=f"Invalid {coord} position: {pos[coord]}. Must be percentage",
@@ -2914,7 +3717,7 @@ def validate_style_id(style_id: str, location: str) -> List[ValidationIssue]:
     """
     issues = []
 
-    if not re.match(r"^[A-Za-z0-9_-]{1,64}$", style_id):
+    if not _is_valid_id(style_id):
         issues.append(
             ValidationIssue(
                 message=f"Invalid 'style_id' format '{style_id}'. Must be 1 to 64 characters long, containing only letters, digits, underscores, or hyphens.",
@@ -3288,7 +4091,9 @@ def validate_root_structure(stj: STJ) -> List[ValidationIssue]:
     return issues
 
 
-def validate_stj(stj: STJ) -> List[ValidationIssue]:
+def validate_stj(
+    stj: STJ, fail_fast: bool = False, deep: bool = False
+) -> List[ValidationIssue]:
     """Performs comprehensive validation of STJ data following the specification sequence.
 
     Executes the complete validation sequence according to STJ specification:
@@ -3300,6 +4105,12 @@ def validate_stj(stj: STJ) -> List[ValidationIssue]:
 
     Args:
         stj (STJ): STJ object to validate
+        fail_fast (bool): If True, return as soon as a validation stage reports
+            issues instead of running the remaining stages
+        deep (bool): If True, keep running the remaining stages even when
+            the type stage finds a structurally invalid section (such as
+            metadata that is not a dictionary). By default validation stops
+            there, since later stages would only report consequences of it
 
     Returns:
         List[ValidationIssue]: List of all validation issues found. Empty list if valid.
@@ -3320,7 +4131,7 @@ def validate_stj(stj: STJ) -> List[ValidationIssue]:
 
     Note:
         - Validates all aspects of the STJ specification
-        - Returns all found issues, not just the first error
+        - Returns all found issues, not just the first error (unless fail_fast)
         - Includes errors, warnings, and informational messages
         - Provides detailed location information for issues
         - References relevant specification sections
@@ -3337,30 +4148,79 @@ def validate_stj(stj: STJ) -> List[ValidationIssue]:
     if issues:
         return issues
 
+    # Run the semantic and type checks of the segments in a single walk; the
+    # type issues are only reported if the transcript stage passes
+    transcript = stj.transcript
+    metadata = stj.metadata
+    segment_issues = segment_type_issues = None
+    if (
+        transcript is not None
+        and transcript._invalid_segments_type is None
+        and isinstance(transcript.segments, list)
+        and transcript.segments
+    ):
+        segment_issues = []
+        segment_type_issues = []
+        _walk_segments(transcript.segments, segment_type_issues, segment_issues)
+
     # Validate transcript (including empty segments check)
-    issues.extend(validate_transcript(stj.transcript))
+    issues.extend(_validate_transcript(transcript, segment_issues))
 
     # Only proceed with other validations if basic structure is valid
-    if not issues:
-        # Field Validation
-        issues.extend(validate_types(stj))
+    if issues:
+        return issues
 
-        # Reference Validation
-        issues.extend(validate_references(stj.transcript))
+    # Field Validation
+    issues.extend(_validate_types(stj, fail_fast, segment_type_issues))
+    if issues and fail_fast:
+        return issues
+    if not deep and any(issue.error_code == "INVALID_STRUCTURE" for issue in issues):
+        return issues
 
-        # Validate metadata if present
-        if stj.metadata:
-            issues.extend(validate_metadata(stj.metadata))
+    # Reference Validation
+    issues.extend(validate_references(transcript))
+    if issues and fail_fast:
+        return issues
 
-        # Validate language codes and consistency
-        issues.extend(validate_language_codes(stj.metadata, stj.transcript))
-        issues.extend(validate_language_consistency(stj.metadata, stj.transcript))
+    # Validate metadata if present
+    if metadata:
+        issues.extend(validate_metadata(metadata))
+        if issues and fail_fast:
+            return issues
 
-        # Validate confidence scores
-        issues.extend(validate_confidence_scores(stj.transcript))
+    # Collect the segment languages and confidence issues in a single walk.
+    # Segment language codes were already checked by the transcript stage,
+    # which stops validation if any is invalid, so they are not checked again
+    segment_languages = []
+    confidence_issues = []
+    if transcript is not None and transcript.segments:
+        _walk_segments(
+            transcript.segments,
+            confidence_issues=confidence_issues,
+            languages=segment_languages,
+        )
+
+    # Validate language codes and consistency. Documents without any language
+    # codes skip this stage, which would otherwise load the ISO 639 tables
+    has_languages = bool(segment_languages) or (
+        metadata is not None
+        and bool(metadata.languages or (metadata.source and metadata.source.languages))
+    )
+    if has_languages:
+        issues.extend(_validate_language_codes(metadata, transcript, []))
+        issues.extend(
+            _validate_language_consistency(metadata, transcript, segment_languages)
+        )
+        if issues and fail_fast:
+            return issues
+
+    # Validate confidence scores
+    issues.extend(confidence_issues)
+    if issues and fail_fast:
+        return issues
 
-        # Extensions Validation
-        issues.extend(validate_all_extensions(stj))
+    # Extensions Validation
+    issues.extend(validate_all_extensions(stj))
 
     return issues
 
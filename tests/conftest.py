@@ -0,0 +1,73 @@
+# tests/conftest.py
+
+"""
+Shared pytest fixtures for the STJ test suite.
+
+Tests that modify an STJ instance use the function-scoped empty_stj fixture.
+Tests that only read from one share the module-scoped sample_stj and
+valid_stj fixtures and must not modify them.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from stjlib import StandardTranscriptionJSON
+from stjlib.core.data_classes import (
+    Metadata,
+    Segment,
+    Speaker,
+    Transcriber,
+    Transcript,
+    Word,
+)
+from stjlib.core.enums import WordTimingMode
+
+
+@pytest.fixture
+def empty_stj():
+    """Provides a new StandardTranscriptionJSON instance for each test."""
+    return StandardTranscriptionJSON()
+
+
+@pytest.fixture(scope="module")
+def sample_stj():
+    """Provides a read-only instance with one speaker and three segments.
+
+    Segments "Test 1" and "Test 2" belong to speaker "s1"; "Test 3" has no
+    speaker.
+    """
+    stj = StandardTranscriptionJSON()
+    stj.add_speaker("s1", "Speaker One")
+    stj.add_segment(text="Test 1", start=0.0, end=1.0, speaker_id="s1")
+    stj.add_segment(text="Test 2", start=1.0, end=2.0, speaker_id="s1")
+    stj.add_segment(text="Test 3", start=2.0, end=3.0)  # No speaker
+    return stj
+
+
+@pytest.fixture(scope="module")
+def valid_stj():
+    """Provides a read-only, fully populated instance that passes validation."""
+    metadata = Metadata(
+        transcriber=Transcriber(name="TestTranscriber", version="1.0.0"),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        languages=["en"],
+    )
+    segment = Segment(
+        start=0.0,
+        end=5.0,
+        text="Hello world",
+        speaker_id="speaker1",
+        confidence=0.9,
+        language="en",
+        words=[
+            Word(start=0.0, end=1.0, text="Hello", confidence=0.95),
+            Word(start=1.0, end=2.0, text="world", confidence=0.9),
+        ],
+        word_timing_mode=WordTimingMode.COMPLETE,
+    )
+    transcript = Transcript(
+        segments=[segment], speakers=[Speaker(id="speaker1", name="Speaker One")]
+    )
+    return StandardTranscriptionJSON(
+        metadata=metadata, transcript=transcript, validate=False
+    )
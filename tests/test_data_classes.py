@@ -8,7 +8,7 @@ ensuring that they correctly handle various input scenarios.
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from stjlib.core.data_classes import (
     STJ,
@@ -19,6 +19,7 @@ from stjlib.core.data_classes import (
     Speaker,
     Style,
     Transcriber,
+    _iso_z,
 )
 from stjlib.core.enums import WordTimingMode
 
@@ -179,3 +180,88 @@ def test_metadata_optional_created_at():
     metadata = Metadata.from_dict(data_with_timestamp)
     expected_datetime = datetime(2024, 3, 20, 12, 0, tzinfo=timezone.utc)
     assert metadata.created_at == expected_datetime
+
+
+def test_metadata_created_at_parsing():
+    """Test parsing of created_at values that fromisoformat may not read."""
+    metadata = Metadata.from_dict({"created_at": "2024-03-20T12:00:00.5Z"})
+    assert metadata.created_at == datetime(
+        2024, 3, 20, 12, 0, 0, 500000, tzinfo=timezone.utc
+    )
+
+    # Invalid values are preserved and serialized as-is for validation
+    for value in ["not a date", 20240320, "2024-W12", "2024-03", "20240320T1200"]:
+        metadata = Metadata.from_dict({"created_at": value})
+        assert metadata.created_at == value
+        assert metadata.to_dict() == {"created_at": value}
+
+
+def test_iso_z_formatting():
+    """Test formatting of created_at timestamps as UTC with a 'Z' suffix."""
+    assert _iso_z(datetime(2024, 3, 20, 12, tzinfo=timezone.utc)) == (
+        "2024-03-20T12:00:00Z"
+    )
+    offset = timezone(timedelta(hours=2))
+    assert _iso_z(datetime(2024, 3, 20, 14, 0, 0, 500, tzinfo=offset)) == (
+        "2024-03-20T12:00:00.000500Z"
+    )
+
+
+def test_data_classes_use_slots():
+    """Test that data class instances keep fields in slots, not a __dict__."""
+    word = Word(text="hello", start=0.0, end=0.5)
+    assert not hasattr(word, "__dict__")
+    with pytest.raises(AttributeError):
+        word.unknown_field = True
+
+    segment = Segment(text="hello", words=[word])
+    assert Segment.from_dict(segment.to_dict()) == segment
+
+
+def test_word_batch_conversion():
+    """Test that batch word conversion matches converting words one by one."""
+    items = [
+        {"text": "hello", "start": 0.0, "end": 0.5, "confidence": 0.9},
+        {"text": "[noise]", "start": 0.5, "end": 0.5, "is_zero_duration": True},
+        {"text": "world", "extensions": {"ns": {"key": "value"}}},
+    ]
+    words = Word.from_dicts(items)
+    assert words == [Word.from_dict(item) for item in items]
+    assert words[2].to_dict() == items[2]
+    assert Word.to_dicts(words) == [word.to_dict() for word in words] == items
+
+    with pytest.raises(KeyError):
+        Word.from_dicts([{"start": 0.0}])
+
+
+def test_repeated_identifiers_are_interned():
+    """Test that IDs and language codes read from dicts share one string."""
+    speaker_id = "".join(["speaker", "1"])  # Built at runtime, not interned
+    segments = [
+        Segment.from_dict(
+            {"text": "Hi", "speaker_id": "".join(["speaker", "1"]), "language": "en"}
+        )
+        for _ in range(2)
+    ]
+    speaker = Speaker.from_dict({"id": speaker_id})
+    assert segments[0].speaker_id is segments[1].speaker_id is speaker.id
+    assert segments[0].language is segments[1].language
+
+    # Non-string values are preserved for validation
+    assert Segment.from_dict({"text": "Hi", "speaker_id": 5}).speaker_id == 5
+
+
+def test_segment_word_timing_mode_parsing():
+    """Test that word_timing_mode values map to enum members or raise."""
+    for mode in WordTimingMode:
+        segment = Segment.from_dict({"text": "Hi", "word_timing_mode": mode.value})
+        assert segment.word_timing_mode is mode
+    segment = Segment.from_dict(
+        {"text": "Hi", "word_timing_mode": WordTimingMode.PARTIAL}
+    )
+    assert segment.word_timing_mode is WordTimingMode.PARTIAL
+
+    with pytest.raises(ValueError):
+        Segment.from_dict({"text": "Hi", "word_timing_mode": "sometimes"})
+    with pytest.raises(ValueError):
+        Segment.from_dict({"text": "Hi", "word_timing_mode": ["complete"]})
@@ -24,6 +24,8 @@ from stjlib.validation import (
     ValidationIssue,
     ValidationSeverity,
     validate_stj,
+    validate_styles,
+    validate_types,
 )
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -188,6 +190,137 @@ def test_validate_zero_duration():
     )
 
 
+def test_validate_fail_fast():
+    """Test that fail_fast stops after the first stage that reports issues."""
+    transcript = Transcript(
+        segments=[Segment(text="Test", speaker_id="missing_speaker", confidence=1.5)],
+    )
+    stj_instance = STJ(version="0.6.0", metadata=None, transcript=transcript)
+
+    all_issues = validate_stj(stj_instance)
+    assert any("Invalid speaker_id reference" in i.message for i in all_issues)
+    assert any("out of range" in i.message for i in all_issues)
+
+    fast_issues = validate_stj(stj_instance, fail_fast=True)
+    assert fast_issues
+    assert all("Invalid speaker_id reference" in i.message for i in fast_issues)
+
+
+def test_validate_non_numeric_confidence():
+    """Test that a non-numeric confidence is a type issue, not a crash."""
+    segment = Segment(
+        text="Test",
+        start=0.0,
+        end=1.0,
+        confidence="high",
+        words=[Word(text="Test", start=0.0, end=1.0, confidence=2.0)],
+    )
+    stj_instance = STJ(
+        version="0.6.0", metadata=None, transcript=Transcript(segments=[segment])
+    )
+    issues = validate_stj(stj_instance)
+
+    assert [issue.location for issue in issues] == [
+        "transcript.segments[0].confidence",
+        "transcript.segments[0].words[0].confidence",
+    ]
+    assert "must be of type int or float" in issues[0].message
+    assert "out of range" in issues[1].message
+
+
+def test_validate_stops_at_invalid_structure():
+    """Test that later stages are skipped for a structurally invalid section."""
+    transcript = Transcript(segments=[Segment(text="Test", confidence=1.5)])
+    metadata = Metadata(_invalid_type="str")
+    stj_instance = STJ(version="0.6.0", metadata=metadata, transcript=transcript)
+
+    issues = validate_stj(stj_instance)
+    assert [issue.error_code for issue in issues] == ["INVALID_STRUCTURE"]
+
+    deep_issues = validate_stj(stj_instance, deep=True)
+    assert any("out of range" in i.message for i in deep_issues)
+
+
+def test_validate_types_numeric_field_type():
+    """Test type errors for fields that accept several types."""
+    segment = Segment(
+        text="Test",
+        confidence="high",  # Must be int or float
+        words=[Word(text="Test", confidence="low")],
+    )
+    transcript = Transcript(segments=[segment])
+    stj_instance = STJ(version="0.6.0", metadata=None, transcript=transcript)
+    issues = validate_types(stj_instance)
+
+    messages = [issue.message for issue in issues]
+    assert (
+        "Field transcript.segments[0].confidence must be of type int or float if present"
+        in messages
+    )
+    assert (
+        "Field transcript.segments[0].words[0].confidence must be of type int or float if present"
+        in messages
+    )
+
+
+def test_validate_speaker_and_style_id_format():
+    """Test speaker_id and style_id format validation."""
+    from stjlib.validation import validate_speaker_id, validate_style_id
+
+    for valid_id in ["speaker-1", "SPEAKER_A", "a", "x" * 64]:
+        assert validate_speaker_id(valid_id, "loc") == []
+        assert validate_style_id(valid_id, "loc") == []
+
+    for invalid_id in ["", "speaker@1", "speaker 1", "x" * 65, "speaker\n", "é"]:
+        assert validate_speaker_id(invalid_id, "loc")
+        assert validate_style_id(invalid_id, "loc")
+
+
+def test_validate_non_zero_duration_word_flag():
+    """Test that a flagged word with non-zero duration is still reported."""
+    segment = Segment(
+        text="Test word",
+        start=0.0,
+        end=2.0,
+        words=[
+            Word(text="Test", start=0.0, end=1.0, is_zero_duration=True),
+            Word(text="word", start=1.0, end=2.0),
+        ],
+    )
+    transcript = Transcript(segments=[segment])
+    stj_instance = STJ(version="0.6.0", metadata=None, transcript=transcript)
+    issues = validate_stj(stj_instance)
+
+    zero_duration_issues = [
+        issue
+        for issue in issues
+        if "Non-zero duration item cannot have is_zero_duration set to true"
+        in issue.message
+    ]
+    assert len(zero_duration_issues) == 1
+    assert zero_duration_issues[0].location == "transcript.segments[0].words[0]"
+
+
+def test_validate_word_time_format_reported_once():
+    """Test that an invalid word time produces a single issue."""
+    segment = Segment(
+        text="Test word",
+        start=0.0,
+        end=2.0,
+        words=[
+            Word(text="Test", start=0.0001, end=1.0),
+            Word(text="word", start=1.0, end=2.0),
+        ],
+    )
+    transcript = Transcript(segments=[segment])
+    stj_instance = STJ(version="0.6.0", metadata=None, transcript=transcript)
+    issues = validate_stj(stj_instance)
+
+    assert [issue.location for issue in issues] == [
+        "transcript.segments[0].words[0].start"
+    ]
+
+
 def test_validate_confidence_scores():
     """Test validation of confidence scores."""
     segment = Segment(
@@ -251,6 +384,19 @@ def test_validate_segment_text_matches_words():
     )
 
 
+def test_word_text_consistency_ignores_punctuation():
+    """Test that the lenient text check ignores case, punctuation and spacing."""
+    from stjlib.validation import validators
+
+    words = [Word(text="Hello"), Word(text="there")]
+    for text in ["Hello there", "hello,  there!"]:
+        segment = Segment(text=text, words=words)
+        assert validators._validate_word_text_consistency(segment, 0, words) == []
+    segment = Segment(text="Hello world", words=words)
+    issues = validators._validate_word_text_consistency(segment, 0, words)
+    assert [issue.location for issue in issues] == ["transcript.segments[0]"]
+
+
 def test_validate_word_timing_sequence():
     """Test validation of word timing sequence within segments."""
     segment = Segment(
@@ -324,18 +470,9 @@ def test_validate_time_formats():
     for time in valid_times:
         stj = create_stj_with_time(time)
         issues = validate_stj(stj)
-        assert not any(
-            (
-                "time value" in issue.message.lower()
-                and (
-                    "invalid" in issue.message.lower()
-                    or "must be non-negative" in issue.message.lower()
-                    or "exceeds maximum" in issue.message.lower()
-                    or "decimal places" in issue.message.lower()
-                )
-            )
-            for issue in issues
-        ), f"Time {time} should be valid"
+        assert "INVALID_TIME_FORMAT" not in {
+            issue.error_code for issue in issues
+        }, f"Time {time} should be valid"
 
     # Test invalid times
     invalid_times = [
@@ -347,18 +484,9 @@ def test_validate_time_formats():
     for time in invalid_times:
         stj = create_stj_with_time(time)
         issues = validate_stj(stj)
-        assert any(
-            (
-                "time value" in issue.message.lower()
-                and (
-                    "invalid" in issue.message.lower()
-                    or "must be non-negative" in issue.message.lower()
-                    or "exceeds maximum" in issue.message.lower()
-                    or "decimal places" in issue.message.lower()
-                )
-            )
-            for issue in issues
-        ), f"Time {time} should be invalid"
+        assert "INVALID_TIME_FORMAT" in {
+            issue.error_code for issue in issues
+        }, f"Time {time} should be invalid"
 
 
 def test_invalid_additional_properties():
@@ -417,3 +545,245 @@ def test_validate_iso639_3_code_with_iso639_1_available():
         "Must use ISO 639-1 code 'en' instead of ISO 639-3 code 'eng'" in msg
         for msg in messages
     )
+
+
+def _long_word_list_document():
+    """Segment with 100 words, checked by validate_words_in_segment."""
+    words = [Word(text="w", start=i * 0.5, end=i * 0.5 + 0.5) for i in range(100)]
+    words[10] = Word(text="w", start=5.0, end=5.0)  # Zero duration, no flag
+    words[20] = Word(text="w", start=9.9, end=10.5)  # Overlaps previous word
+    words[30] = Word(text="w", start=15.0, end=15.1234)  # Too many decimals
+    words[40] = Word(text="w", start=20.0, end=20.5, is_zero_duration=True)
+    segment = Segment(
+        text=" ".join(w.text for w in words),
+        start=0.0,
+        end=50.0,
+        words=words,
+        word_timing_mode="partial",
+    )
+    return "validate_words_in_segment", (segment, 0)
+
+
+def _long_segment_list_document():
+    """Transcript with 100 segments, checked by validate_segments."""
+    segments = [Segment(text="a", start=i * 1.0, end=i + 1.0) for i in range(100)]
+    segments[10] = Segment(text="a", start=10.0, end=10.0)  # Zero duration
+    segments[20] = Segment(text="a", start=19.5, end=21.0)  # Overlap
+    segments[30] = Segment(text="a", start=30.0, end=31.0, is_zero_duration=True)
+    segments[40] = Segment(text="a", start=40.0, end=41.0, speaker_id="bad id")
+    return "validate_segments", (Transcript(segments=segments),)
+
+
+def _many_short_word_lists_document():
+    """Transcript with 40 three-word segments, checked by validate_segments."""
+    segments = [
+        Segment(
+            text="a b c",
+            start=i * 1.0,
+            end=i + 1.0,
+            words=[
+                Word(text=text, start=i + k * 0.25, end=i + (k + 1) * 0.25)
+                for k, text in enumerate("abc")
+            ],
+        )
+        for i in range(40)
+    ]
+    segments[5].words[1].start = 5.1  # Overlaps the previous word
+    segments[12].words[2].end = 13.5  # Ends after the segment
+    segments[21].words[0].start = 21.1234  # Too many decimal places
+    segments[33].words[2].is_zero_duration = True
+    return "validate_segments", (Transcript(segments=segments),)
+
+
+def _many_confidences_document():
+    """Transcript with 120 confidences, checked by validate_confidence_scores."""
+    segments = [
+        Segment(
+            text="a b",
+            confidence=0.9,
+            words=[Word(text="a", confidence=0.8), Word(text="b", confidence=1)],
+        )
+        for _ in range(40)
+    ]
+    segments[3].confidence = 1.5
+    segments[17].words[1].confidence = -0.1
+    segments[29].words[0].confidence = float("nan")
+    return "validate_confidence_scores", (Transcript(segments=segments),)
+
+
+@pytest.mark.parametrize(
+    "build_document, expected_count",
+    [
+        (_long_word_list_document, 4),
+        (_long_segment_list_document, 4),
+        (_many_short_word_lists_document, 4),
+        (_many_confidences_document, 3),
+    ],
+    ids=["long_word_list", "long_segment_list", "many_short_word_lists", "confidences"],
+)
+def test_numpy_prescreen_matches_without_numpy(
+    monkeypatch, build_document, expected_count
+):
+    """Test that each NumPy pre-screen reports the same issues as the plain checks."""
+    pytest.importorskip("numpy")
+    from stjlib.validation import validators
+
+    function_name, args = build_document()
+    validate = getattr(validators, function_name)
+    with_numpy = [str(i) for i in validate(*args)]
+    monkeypatch.setattr(validators, "np", None)
+    without_numpy = [str(i) for i in validate(*args)]
+
+    assert len(with_numpy) == expected_count
+    assert with_numpy == without_numpy
+
+
+def test_word_timing_sweep_kernels_agree(monkeypatch):
+    """Test that the loop (Numba) and vectorized word timing sweeps agree."""
+    np = pytest.importorskip("numpy")
+    from stjlib.validation import validators
+
+    monkeypatch.setattr(validators, "USE_JIT", True)
+
+    starts = np.array([0.0, 1.0, 1.5, 3.0, 3.0, 4.0, 9.0])
+    ends = np.array([1.0, 2.0, 2.5, 3.0, 2.0, 5.0, 12.0])
+    for segment_start, segment_end in [(0.0, 10.0), (0.5, 20.0), (-np.inf, np.inf)]:
+        expected = validators._sweep_word_timings_vectorized(
+            starts, ends, segment_start, segment_end
+        )
+        assert (
+            validators._sweep_word_timings_loop(
+                starts, ends, segment_start, segment_end
+            )
+            == expected
+        ).all()
+        assert (
+            validators._sweep_word_timings(starts, ends, segment_start, segment_end)
+            == expected
+        ).all()
+
+
+def test_validate_style_text_properties():
+    """Test that each style text property is checked by its own rule."""
+    style = Style(
+        id="style1",
+        text={
+            "bold": "yes",
+            "color": "#FFFFFF",
+            "background": "white",
+            "size": "0%",
+            "opacity": "150%",
+            "blink": True,
+        },
+    )
+    transcript = Transcript(segments=[], styles=[style])
+    messages = [issue.message for issue in validate_styles(transcript)]
+    assert messages == [
+        "Invalid bold value: yes. Must be a boolean",
+        "Invalid color format for background: white. Must be in #RRGGBB format",
+        "'size' must be greater than 0%, got 0%",
+        "'opacity' must be between 0% and 100%, got 150%",
+        "Invalid text property: blink",
+    ]
+
+
+def test_validate_style_display_values():
+    """Test that invalid display values list the allowed values in order."""
+    style = Style(id="style1", display={"align": "justify", "vertical": "center"})
+    transcript = Transcript(segments=[], styles=[style])
+    messages = [issue.message for issue in validate_styles(transcript)]
+    assert messages == [
+        "Invalid align value: justify. Must be one of: center, left, right",
+        "Invalid vertical value: center. Must be one of: bottom, middle, top",
+    ]
+
+
+def test_confidence_kernels_agree(monkeypatch):
+    """Test that the loop (Numba) and vectorized confidence checks agree."""
+    np = pytest.importorskip("numpy")
+    from stjlib.validation import validators
+
+    monkeypatch.setattr(validators, "USE_JIT", True)
+
+    confidences = np.array([0.0, 1.0, 0.5, -0.1, 1.01, np.nan, np.inf])
+    expected = validators._flag_confidences_vectorized(confidences)
+    assert expected.tolist() == [False, False, False, True, True, True, True]
+    assert validators._flag_confidences_loop(confidences).tolist() == (
+        expected.tolist()
+    )
+    assert validators._flag_confidences(confidences).tolist() == expected.tolist()
+
+
+def test_lookup_language_caches_unknown_codes():
+    """Test that unknown language codes are cached as None, not raised."""
+    from stjlib.validation import validators
+
+    validators._lookup_language.cache_clear()
+    assert validators._lookup_language("invalid-code") is None
+    assert validators._lookup_language("invalid-code") is None
+    assert validators._lookup_language("en").pt1 == "en"
+    info = validators._lookup_language.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_validate_skips_language_checks_without_codes(monkeypatch):
+    """Test that documents without language codes skip the language stage."""
+    from stjlib.validation import validators
+
+    def fail(*args):
+        raise AssertionError("language stage should be skipped")
+
+    monkeypatch.setattr(validators, "_validate_language_consistency", fail)
+    stj = STJ(
+        version="0.6.0",
+        transcript=Transcript(segments=[Segment(text="Hi", start=0.0, end=1.0)]),
+    )
+    assert validate_stj(stj) == []
+
+    stj.transcript.segments[0].language = "en"
+    with pytest.raises(AssertionError):
+        validate_stj(stj)
+
+
+def test_numba_kernels_are_opt_in(monkeypatch):
+    """Test that the screening kernels only use Numba when USE_JIT is set."""
+    np = pytest.importorskip("numpy")
+    from stjlib.validation import validators
+
+    def fail(kernel):
+        raise AssertionError("Numba should not be used")
+
+    monkeypatch.setattr(validators, "USE_JIT", False)
+    monkeypatch.setattr(validators, "_jit_compile", fail)
+    starts = np.array([0.0, 1.0])
+    ends = np.array([1.0, 2.0])
+    assert not validators._sweep_word_timings(starts, ends, 0.0, 2.0).any()
+    assert validators._flag_confidences(np.array([0.5, 1.5])).tolist() == [
+        False,
+        True,
+    ]
+
+
+def test_validate_created_at_non_timestamp_forms():
+    """Test that ISO 8601 forms other than date-times are invalid created_at."""
+    from stjlib import StandardTranscriptionJSON
+
+    for value in ["2024-W12", "2024-03"]:
+        data = {
+            "stj": {
+                "version": "0.6.0",
+                "metadata": {
+                    "transcriber": {"name": "Test", "version": "1.0"},
+                    "created_at": value,
+                },
+                "transcript": {"segments": [{"text": "Hi"}]},
+            }
+        }
+        stj = StandardTranscriptionJSON.from_dict(data)
+        issues = stj.validate(raise_exception=False)
+        assert {issue.location for issue in issues} == {"metadata.created_at"}
+        assert "Invalid 'created_at' format. Must be a valid ISO 8601 timestamp." in [
+            issue.message for issue in issues
+        ]
+        assert not any("timezone-aware" in issue.message for issue in issues)
+        assert stj.to_dict()["stj"]["metadata"]["created_at"] == value